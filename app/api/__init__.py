@@ -1,8 +1,34 @@
 """API endpoints package."""
+import logging
+
 from flask import Blueprint
+from werkzeug.exceptions import HTTPException
+from app.api.responses import ojson
+from app.config.database import SessionLocal
+
+logger = logging.getLogger(__name__)
 
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
+
+@api_bp.teardown_request
+def _remove_session(exc=None):
+    """Return the request's thread-local DB session to the pool."""
+    SessionLocal.remove()
+
+
+@api_bp.errorhandler(Exception)
+def _handle_unexpected_error(e):
+    """Return the standard 500 payload for exceptions a handler didn't catch."""
+    # Let aborts (404, 405, 415 from get_json, ...) keep their own status
+    if isinstance(e, HTTPException):
+        return e
+    logger.exception("Unhandled error in %s", e.__class__.__name__)
+    return ojson({
+        'success': False,
+        'error': str(e)
+    }, 500)
+
+
 # Import all endpoints to register routes
 from app.api import system, irrigation, fertigation, schedules, logs, alerts, sensors, weather, solenoids
-
@@ -1,106 +1,125 @@
 """Alert API endpoints."""
-from flask import Blueprint, jsonify, request
+import threading
+from flask import Blueprint, request
 from app.api import api_bp
-from app.config.database import get_db
+from app.api.responses import ojson, dumps, conditional_response, ResponseCache
+from app.api.logs import hours_ago
+from app.config.database import SessionLocal
 from app.models.system_log import SystemLog, LogLevel
-from datetime import datetime, timedelta
+from operator import attrgetter
+from sqlalchemy import case, func, event
 
 alerts_bp = Blueprint('alerts', __name__)
 api_bp.register_blueprint(alerts_bp, url_prefix='/alerts')
 
 # In-memory alert tracking (could be moved to database)
 active_alerts = {}
+_alerts_lock = threading.Lock()
+
+_ALERT_FIELDS = ('id', 'timestamp', 'log_level', 'component', 'message', 'error_code', 'zone_id', 'sensor_id')
+_ALERT_COLUMNS = attrgetter(*_ALERT_FIELDS)(SystemLog)
+
+
+def _to_alert_row(row):
+    return dict(zip(_ALERT_FIELDS, row))
+
+
+# Short-lived cache of the serialized alerts response for polling dashboards
+_response_cache = ResponseCache(maxsize=256, ttl=2.0)
+
+
+@event.listens_for(SystemLog, 'after_insert')
+def _invalidate_alerts(mapper, connection, target):
+    _response_cache.invalidate()
 
 
 @alerts_bp.route('', methods=['GET'])
 def get_alerts():
     """Get active alerts and errors."""
     try:
-        db = next(get_db())
+        cache_key = _response_cache.request_key()
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return conditional_response(*cached)
         
-        # Get recent errors and warnings
-        cutoff_time = datetime.now() - timedelta(hours=24)  # Last 24 hours
+        db = SessionLocal()
         
-        errors = db.query(SystemLog).filter(
-            SystemLog.log_level.in_([LogLevel.ERROR, LogLevel.CRITICAL]),
-            SystemLog.timestamp >= cutoff_time
-        ).order_by(SystemLog.timestamp.desc()).limit(50).all()
+        # Get recent errors and warnings
+        cutoff_time = hours_ago(24)  # Last 24 hours
         
-        warnings = db.query(SystemLog).filter(
-            SystemLog.log_level == LogLevel.WARNING,
+        # Single query: rank rows per bucket (errors/criticals vs warnings) so
+        # each bucket keeps its own newest-50 limit.
+        is_warning = case((SystemLog.log_level == LogLevel.WARNING, 1), else_=0)
+        ranked = db.query(
+            SystemLog.id.label('id'),
+            func.row_number().over(
+                partition_by=is_warning,
+                order_by=SystemLog.timestamp.desc()
+            ).label('rank')
+        ).filter(
+            SystemLog.log_level.in_([LogLevel.ERROR, LogLevel.CRITICAL, LogLevel.WARNING]),
             SystemLog.timestamp >= cutoff_time
-        ).order_by(SystemLog.timestamp.desc()).limit(50).all()
+        ).subquery()
         
-        error_list = [{
-            'id': log.id,
-            'timestamp': log.timestamp.isoformat() if log.timestamp else None,
-            'log_level': log.log_level.value if log.log_level else None,
-            'component': log.component,
-            'message': log.message,
-            'error_code': log.error_code,
-            'zone_id': log.zone_id,
-            'sensor_id': log.sensor_id
-        } for log in errors]
+        rows = db.query(*_ALERT_COLUMNS).join(
+            ranked, SystemLog.id == ranked.c.id
+        ).filter(ranked.c.rank <= 50).order_by(SystemLog.timestamp.desc()).all()
         
-        warning_list = [{
-            'id': log.id,
-            'timestamp': log.timestamp.isoformat() if log.timestamp else None,
-            'log_level': log.log_level.value if log.log_level else None,
-            'component': log.component,
-            'message': log.message,
-            'error_code': log.error_code,
-            'zone_id': log.zone_id,
-            'sensor_id': log.sensor_id
-        } for log in warnings]
+        error_list = []
+        warning_list = []
+        for row in rows:
+            (warning_list if row[2] == LogLevel.WARNING else error_list).append(_to_alert_row(row))
         
-        db.close()
+        with _alerts_lock:
+            active_snapshot = list(active_alerts.values())
         
-        return jsonify({
+        body = dumps({
             'success': True,
             'alerts': {
                 'errors': error_list,
                 'warnings': warning_list,
-                'active_alerts': list(active_alerts.values())
+                'active_alerts': active_snapshot
             },
             'counts': {
                 'errors': len(error_list),
                 'warnings': len(warning_list),
-                'active': len(active_alerts)
+                'active': len(active_snapshot)
             }
-        }), 200
+        })
+        etag = _response_cache.set(cache_key, body)
+        return conditional_response(body, etag)
         
     except Exception as e:
-        return jsonify({
+        return ojson({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
-@alerts_bp.route('/<int:alert_id>/acknowledge', methods=['POST'])
+@alerts_bp.route('/<int(min=1, max=2147483647):alert_id>/acknowledge', methods=['POST'])
 def acknowledge_alert(alert_id):
     """Acknowledge an alert."""
     try:
-        db = next(get_db())
+        db = SessionLocal()
         
         # Check if it's a system log entry
-        log_entry = db.query(SystemLog).filter_by(id=alert_id).first()
+        log_entry = db.get(SystemLog, alert_id)
         
         if log_entry:
             # Mark as acknowledged (could add acknowledged field to model)
             # For now, just remove from active alerts if present
-            if alert_id in active_alerts:
-                del active_alerts[alert_id]
-        
-        db.close()
+            with _alerts_lock:
+                if active_alerts.pop(alert_id, None) is not None:
+                    _response_cache.invalidate()
         
-        return jsonify({
+        return ojson({
             'success': True,
             'message': 'Alert acknowledged'
-        }), 200
+        }, 200)
         
     except Exception as e:
-        return jsonify({
+        return ojson({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
@@ -1,25 +1,39 @@
 """Fertigation API endpoints."""
 from flask import Blueprint, jsonify, request
 from app.api import api_bp
+from app.api.responses import dumps, json_response
 from app.config.config import ZONE_ID
 
 fertigation_bp = Blueprint('fertigation', __name__)
 api_bp.register_blueprint(fertigation_bp, url_prefix='/fertigation')
 
-# Global controllers (will be initialized in app.py)
+# Global controllers (will be initialized in main.py via set_controllers)
 controllers = {}
+_fertigation_ctrl = None
+
+# Constant error payloads, serialized once at import
+_NOT_INITIALIZED_BODY = dumps({'success': False, 'error': 'Fertigation controller not initialized'})
+
+
+def set_controllers(cfg):
+    """
+    Bind controller instances used by the fertigation endpoints.
+    
+    Args:
+        cfg: Dict of controllers keyed by name (expects 'fertigation')
+    """
+    global controllers, _fertigation_ctrl
+    controllers = cfg
+    _fertigation_ctrl = cfg.get('fertigation')
 
 
 @fertigation_bp.route('/start', methods=['POST'])
 def start_fertigation():
     """Start fertigation for the system zone."""
     try:
-        fertigation_ctrl = controllers.get('fertigation')
-        if not fertigation_ctrl:
-            return jsonify({
-                'success': False,
-                'error': 'Fertigation controller not initialized'
-            }), 500
+        fertigation_ctrl = _fertigation_ctrl
+        if fertigation_ctrl is None:
+            return json_response(_NOT_INITIALIZED_BODY, 500)
         
         result = fertigation_ctrl.start_fertigation(ZONE_ID)
         
@@ -39,12 +53,9 @@ def start_fertigation():
 def stop_fertigation():
     """Stop current fertigation."""
     try:
-        fertigation_ctrl = controllers.get('fertigation')
-        if not fertigation_ctrl:
-            return jsonify({
-                'success': False,
-                'error': 'Fertigation controller not initialized'
-            }), 500
+        fertigation_ctrl = _fertigation_ctrl
+        if fertigation_ctrl is None:
+            return json_response(_NOT_INITIALIZED_BODY, 500)
         
         result = fertigation_ctrl.stop_fertigation()
         return jsonify(result), 200
@@ -60,12 +71,9 @@ def stop_fertigation():
 def get_fertigation_status():
     """Get fertigation status."""
     try:
-        fertigation_ctrl = controllers.get('fertigation')
-        if not fertigation_ctrl:
-            return jsonify({
-                'success': False,
-                'error': 'Fertigation controller not initialized'
-            }), 500
+        fertigation_ctrl = _fertigation_ctrl
+        if fertigation_ctrl is None:
+            return json_response(_NOT_INITIALIZED_BODY, 500)
         
         status = fertigation_ctrl.get_status()
         return jsonify({
@@ -1,15 +1,33 @@
 """Irrigation API endpoints."""
 from flask import Blueprint, jsonify, request
 from app.api import api_bp
+from app.api.responses import dumps, json_response
 from app.config.config import ZONE_ID
-from app.config.database import get_db
+from app.config.database import session_scope
 from app.utils.system_config_helper import load_system_config
 
 irrigation_bp = Blueprint('irrigation', __name__)
 api_bp.register_blueprint(irrigation_bp, url_prefix='/irrigation')
 
-# Global controllers (will be initialized in app.py)
+# Global controllers (will be initialized in main.py via set_controllers)
 controllers = {}
+_irrigation_ctrl = None
+
+# Constant error payloads, serialized once at import
+_NOT_INITIALIZED_BODY = dumps({'success': False, 'error': 'Irrigation controller not initialized'})
+_MISSING_ZONE_ID_BODY = dumps({'success': False, 'error': 'Missing required field: zone_id'})
+
+
+def set_controllers(cfg):
+    """
+    Bind controller instances used by the irrigation endpoints.
+    
+    Args:
+        cfg: Dict of controllers keyed by name (expects 'irrigation')
+    """
+    global controllers, _irrigation_ctrl
+    controllers = cfg
+    _irrigation_ctrl = cfg.get('irrigation')
 
 
 @irrigation_bp.route('/start', methods=['POST'])
@@ -24,19 +42,13 @@ def start_irrigation():
                 'message': 'Request body must be a JSON object'
             }), 400
 
-        irrigation_ctrl = controllers.get('irrigation')
-        if not irrigation_ctrl:
-            return jsonify({
-                'success': False,
-                'error': 'Irrigation controller not initialized'
-            }), 500
+        irrigation_ctrl = _irrigation_ctrl
+        if irrigation_ctrl is None:
+            return json_response(_NOT_INITIALIZED_BODY, 500)
 
         # Validate requested zone (single-zone system)
         if 'zone_id' not in data:
-            return jsonify({
-                'success': False,
-                'error': 'Missing required field: zone_id'
-            }), 400
+            return json_response(_MISSING_ZONE_ID_BODY, 400)
 
         requested_zone_id = data.get('zone_id')
         if requested_zone_id != ZONE_ID:
@@ -46,11 +58,8 @@ def start_irrigation():
             }), 404
         
         # Load hydraulic / zone config from database-backed SystemConfig
-        db = next(get_db())
-        try:
+        with session_scope() as db:
             cfg = load_system_config(db)
-        finally:
-            db.close()
 
         zone_config = {
             'slope': cfg.get('zone_slope_degrees'),
@@ -87,12 +96,9 @@ def start_irrigation():
 def stop_irrigation():
     """Stop current irrigation."""
     try:
-        irrigation_ctrl = controllers.get('irrigation')
-        if not irrigation_ctrl:
-            return jsonify({
-                'success': False,
-                'error': 'Irrigation controller not initialized'
-            }), 500
+        irrigation_ctrl = _irrigation_ctrl
+        if irrigation_ctrl is None:
+            return json_response(_NOT_INITIALIZED_BODY, 500)
         
         result = irrigation_ctrl.stop_irrigation()
         return jsonify(result), 200
@@ -108,12 +114,9 @@ def stop_irrigation():
 def get_irrigation_status():
     """Get irrigation status."""
     try:
-        irrigation_ctrl = controllers.get('irrigation')
-        if not irrigation_ctrl:
-            return jsonify({
-                'success': False,
-                'error': 'Irrigation controller not initialized'
-            }), 500
+        irrigation_ctrl = _irrigation_ctrl
+        if irrigation_ctrl is None:
+            return json_response(_NOT_INITIALIZED_BODY, 500)
         
         status = irrigation_ctrl.get_status()
         return jsonify({
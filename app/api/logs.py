@@ -1,21 +1,74 @@
 """Log viewing API endpoints."""
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, request
 from app.api import api_bp
-from app.config.database import get_db
+from app.api.responses import ojson, dumps, conditional_response, ResponseCache
+from app.config.database import SessionLocal
 from app.models.sensor_log import SensorLog, SensorType
 from app.models.operational_log import OperationalLog, OperationType
 from app.models.system_log import SystemLog, LogLevel
+import time
+from functools import lru_cache
+from operator import attrgetter
+from sqlalchemy import event
 from datetime import datetime, timedelta
 
 logs_bp = Blueprint('logs', __name__)
 api_bp.register_blueprint(logs_bp, url_prefix='/logs')
 
+# Response fields per log type; the matching model columns are fetched once at
+# import so each row converts with a single C-level zip instead of N lookups.
+_SENSOR_FIELDS = ('id', 'timestamp', 'sensor_type', 'zone_id', 'value', 'unit', 'raw_value', 'raw_unit')
+_SENSOR_COLUMNS = attrgetter(*_SENSOR_FIELDS)(SensorLog)
+
+_OPERATIONAL_FIELDS = (
+    'id', 'timestamp', 'operation_type', 'zone_id', 'status', 'duration', 'pressure',
+    'flow_rate', 'water_volume', 'fertilizer_volume', 'start_moisture', 'end_moisture', 'notes'
+)
+_OPERATIONAL_COLUMNS = attrgetter(*_OPERATIONAL_FIELDS)(OperationalLog)
+
+_SYSTEM_FIELDS = ('id', 'timestamp', 'log_level', 'component', 'message', 'error_code', 'zone_id', 'sensor_id')
+_SYSTEM_COLUMNS = attrgetter(*_SYSTEM_FIELDS)(SystemLog)
+
+
+@lru_cache(maxsize=32)
+def _cutoff(sec_bucket: int, hours: int) -> datetime:
+    return datetime.now() - timedelta(hours=hours)
+
+
+def hours_ago(hours: int) -> datetime:
+    """Return the cutoff timestamp for the last N hours, memoized per second."""
+    return _cutoff(int(time.time()), hours)
+
+
+# Short-lived cache of serialized list responses for dashboards polling at >1 Hz
+_response_cache = ResponseCache(maxsize=256, ttl=2.0)
+
+
+@event.listens_for(SensorLog, 'after_insert')
+def _invalidate_sensor_logs(mapper, connection, target):
+    _response_cache.invalidate('/api/logs/sensor')
+
+
+@event.listens_for(OperationalLog, 'after_insert')
+def _invalidate_operational_logs(mapper, connection, target):
+    _response_cache.invalidate('/api/logs/operational')
+
+
+@event.listens_for(SystemLog, 'after_insert')
+def _invalidate_system_logs(mapper, connection, target):
+    _response_cache.invalidate('/api/logs/system')
+
 
 @logs_bp.route('/sensor', methods=['GET'])
 def get_sensor_logs():
     """Get sensor logs with optional filters."""
     try:
-        db = next(get_db())
+        cache_key = _response_cache.request_key()
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return conditional_response(*cached)
+        
+        db = SessionLocal()
         
         # Get query parameters
         sensor_type = request.args.get('sensor_type')
@@ -23,7 +76,7 @@ def get_sensor_logs():
         limit = request.args.get('limit', default=100, type=int)
         hours = request.args.get('hours', type=int)  # Last N hours
         
-        query = db.query(SensorLog)
+        query = db.query(*_SENSOR_COLUMNS)
         
         if sensor_type:
             try:
@@ -36,41 +89,38 @@ def get_sensor_logs():
             query = query.filter(SensorLog.zone_id == zone_id)
         
         if hours:
-            cutoff_time = datetime.now() - timedelta(hours=hours)
+            cutoff_time = hours_ago(hours)
             query = query.filter(SensorLog.timestamp >= cutoff_time)
         
-        logs = query.order_by(SensorLog.timestamp.desc()).limit(limit).all()
-        
-        result = [{
-            'id': log.id,
-            'timestamp': log.timestamp.isoformat() if log.timestamp else None,
-            'sensor_type': log.sensor_type.value if log.sensor_type else None,
-            'zone_id': log.zone_id,
-            'value': log.value,
-            'unit': log.unit,
-            'raw_value': log.raw_value,
-            'raw_unit': log.raw_unit
-        } for log in logs]
-        
-        db.close()
-        return jsonify({
+        rows = query.order_by(SensorLog.timestamp.desc()).limit(limit).yield_per(200)
+        
+        result = [dict(zip(_SENSOR_FIELDS, row)) for row in rows]
+        
+        body = dumps({
             'success': True,
             'logs': result,
             'count': len(result)
-        }), 200
+        })
+        etag = _response_cache.set(cache_key, body)
+        return conditional_response(body, etag)
         
     except Exception as e:
-        return jsonify({
+        return ojson({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @logs_bp.route('/operational', methods=['GET'])
 def get_operational_logs():
     """Get operational logs."""
     try:
-        db = next(get_db())
+        cache_key = _response_cache.request_key()
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return conditional_response(*cached)
+        
+        db = SessionLocal()
         
         # Get query parameters
         operation_type = request.args.get('operation_type')
@@ -78,7 +128,7 @@ def get_operational_logs():
         limit = request.args.get('limit', default=100, type=int)
         hours = request.args.get('hours', type=int)
         
-        query = db.query(OperationalLog)
+        query = db.query(*_OPERATIONAL_COLUMNS)
         
         if operation_type:
             try:
@@ -91,46 +141,38 @@ def get_operational_logs():
             query = query.filter(OperationalLog.zone_id == zone_id)
         
         if hours:
-            cutoff_time = datetime.now() - timedelta(hours=hours)
+            cutoff_time = hours_ago(hours)
             query = query.filter(OperationalLog.timestamp >= cutoff_time)
         
-        logs = query.order_by(OperationalLog.timestamp.desc()).limit(limit).all()
-        
-        result = [{
-            'id': log.id,
-            'timestamp': log.timestamp.isoformat() if log.timestamp else None,
-            'operation_type': log.operation_type.value if log.operation_type else None,
-            'zone_id': log.zone_id,
-            'status': log.status.value if log.status else None,
-            'duration': log.duration,
-            'pressure': log.pressure,
-            'flow_rate': log.flow_rate,
-            'water_volume': log.water_volume,
-            'fertilizer_volume': log.fertilizer_volume,
-            'start_moisture': log.start_moisture,
-            'end_moisture': log.end_moisture,
-            'notes': log.notes
-        } for log in logs]
-        
-        db.close()
-        return jsonify({
+        rows = query.order_by(OperationalLog.timestamp.desc()).limit(limit).yield_per(200)
+        
+        result = [dict(zip(_OPERATIONAL_FIELDS, row)) for row in rows]
+        
+        body = dumps({
             'success': True,
             'logs': result,
             'count': len(result)
-        }), 200
+        })
+        etag = _response_cache.set(cache_key, body)
+        return conditional_response(body, etag)
         
     except Exception as e:
-        return jsonify({
+        return ojson({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @logs_bp.route('/system', methods=['GET'])
 def get_system_logs():
     """Get system logs."""
     try:
-        db = next(get_db())
+        cache_key = _response_cache.request_key()
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return conditional_response(*cached)
+        
+        db = SessionLocal()
         
         # Get query parameters
         log_level = request.args.get('log_level')
@@ -139,7 +181,7 @@ def get_system_logs():
         limit = request.args.get('limit', default=100, type=int)
         hours = request.args.get('hours', type=int)
         
-        query = db.query(SystemLog)
+        query = db.query(*_SYSTEM_COLUMNS)
         
         if log_level:
             try:
@@ -155,32 +197,24 @@ def get_system_logs():
             query = query.filter(SystemLog.zone_id == zone_id)
         
         if hours:
-            cutoff_time = datetime.now() - timedelta(hours=hours)
+            cutoff_time = hours_ago(hours)
             query = query.filter(SystemLog.timestamp >= cutoff_time)
         
-        logs = query.order_by(SystemLog.timestamp.desc()).limit(limit).all()
-        
-        result = [{
-            'id': log.id,
-            'timestamp': log.timestamp.isoformat() if log.timestamp else None,
-            'log_level': log.log_level.value if log.log_level else None,
-            'component': log.component,
-            'message': log.message,
-            'error_code': log.error_code,
-            'zone_id': log.zone_id,
-            'sensor_id': log.sensor_id
-        } for log in logs]
-        
-        db.close()
-        return jsonify({
+        rows = query.order_by(SystemLog.timestamp.desc()).limit(limit).yield_per(200)
+        
+        result = [dict(zip(_SYSTEM_FIELDS, row)) for row in rows]
+        
+        body = dumps({
             'success': True,
             'logs': result,
             'count': len(result)
-        }), 200
+        })
+        etag = _response_cache.set(cache_key, body)
+        return conditional_response(body, etag)
         
     except Exception as e:
-        return jsonify({
+        return ojson({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
@@ -0,0 +1,139 @@
+"""JSON response helpers for API endpoints."""
+import hashlib
+import threading
+from typing import Optional, Tuple
+
+import orjson
+from cachetools import TTLCache
+from flask import Response, request
+from flask.json.provider import DefaultJSONProvider
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+
+def dumps(data) -> bytes:
+    """Serialize data to JSON bytes with orjson."""
+    return orjson.dumps(data, option=_ORJSON_OPTIONS)
+
+
+def json_response(body: bytes, status: int = 200) -> Response:
+    """Wrap already-serialized JSON bytes in a response."""
+    return Response(body, status=status, mimetype='application/json')
+
+
+def ojson(data, status: int = 200) -> Response:
+    """
+    Serialize data with orjson and wrap it in a JSON response.
+
+    orjson encodes ``datetime`` and ``Enum`` values natively, so handlers can
+    pass model attributes through without ``isoformat()`` / ``.value`` calls.
+
+    Args:
+        data: JSON-serializable payload
+        status: HTTP status code
+
+    Returns:
+        Flask response with ``application/json`` mimetype
+    """
+    return json_response(dumps(data), status)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Installed as ``app.json`` so the remaining ``jsonify`` call sites and
+    ``request.get_json`` use orjson too. Types orjson does not know fall back
+    to Flask's default conversion (``Decimal``, ``UUID``, ``__html__``, ...).
+
+    Output is compact and keys keep insertion order, including in debug mode;
+    set ``app.json.sort_keys = True`` or ``app.json.compact = False`` to get
+    sorted or indented output while debugging.
+    """
+
+    sort_keys = False
+    compact = True
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self._encode(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._encode(obj), mimetype=self.mimetype)
+
+    def _encode(self, obj) -> bytes:
+        option = _ORJSON_OPTIONS | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+
+def etag_for(body: bytes) -> str:
+    """Return a short content hash of a serialized body for use as an ETag."""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def conditional_response(body: bytes, etag: str, status: int = 200) -> Response:
+    """
+    Wrap serialized JSON bytes in a response that honours ``If-None-Match``.
+
+    Args:
+        body: Serialized JSON payload
+        etag: Entity tag for body (see ``etag_for``)
+        status: HTTP status code when the client's copy is stale
+
+    Returns:
+        Empty 304 response if the client already has etag, otherwise the body
+    """
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = json_response(body, status)
+    response.set_etag(etag)
+    return response
+
+
+class ResponseCache:
+    """Thread-safe TTL cache of serialized response bodies and their ETags."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 2.0):
+        """
+        Initialize response cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+            ttl: Time-to-live of each entry in seconds
+        """
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def request_key() -> Tuple:
+        """Build a cache key from the current request path and query args."""
+        return (request.path, tuple(sorted(request.args.items(multi=True))))
+
+    def get(self, key: Tuple) -> Optional[Tuple[bytes, str]]:
+        """Return the cached ``(body, etag)`` for key, or None if missing/expired."""
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: Tuple, body: bytes) -> str:
+        """Store a serialized body under key and return its ETag."""
+        etag = etag_for(body)
+        with self._lock:
+            self._cache[key] = (body, etag)
+        return etag
+
+    def invalidate(self, path: Optional[str] = None):
+        """Drop cached entries for path (or every entry if path is None)."""
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+                return
+            for key in [k for k in self._cache.keys() if k[0] == path]:
+                self._cache.pop(key, None)
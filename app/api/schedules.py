@@ -1,299 +1,279 @@
 """Schedule management API endpoints."""
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, request, stream_with_context
 from app.api import api_bp
-from app.config.database import get_db
+from app.api.responses import ResponseCache, conditional_response, ojson, dumps, json_response
+from app.config.database import SessionLocal
 from app.models.schedule import IrrigationSchedule, FertigationSchedule
 from app.config.config import ZONE_ID
-from datetime import time as dt_time
+from datetime import datetime, time as dt_time
+from functools import lru_cache
+from itertools import count
+from operator import attrgetter
+from sqlalchemy import delete, event, insert, select, update
+from sqlalchemy.orm import Session, object_session
 
 schedules_bp = Blueprint('schedules', __name__)
 api_bp.register_blueprint(schedules_bp, url_prefix='/schedules')
 
+_MISSING_FIELDS_BODY = dumps({'success': False, 'error': 'day_of_week and time are required'})
+_NOT_FOUND_BODY = dumps({'success': False, 'error': 'Schedule not found'})
 
-@schedules_bp.route('/irrigation', methods=['GET'])
-def list_irrigation_schedules():
-    """List all irrigation schedules."""
-    try:
-        db = next(get_db())
-        schedules = db.query(IrrigationSchedule).all()
-        
-        result = [{
-            'id': s.id,
-            'zone_id': s.zone_id,
-            'day_of_week': s.day_of_week,
-            'time': s.time.strftime('%H:%M:%S') if s.time else None,
-            'enabled': s.enabled,
-            'last_run': s.last_run.isoformat() if s.last_run else None
-        } for s in schedules]
-        
-        db.close()
-        return jsonify({
-            'success': True,
-            'schedules': result
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+_SCHEDULE_FIELDS = ('id', 'zone_id', 'day_of_week', 'time', 'enabled', 'last_run')
 
+# Serialized schedule lists with their ETags. Lists only change through the
+# CRUD routes below or the scheduler's ORM last_run updates, both of which
+# clear the cache once committed; the TTL is just a safety net
+_list_cache = ResponseCache(maxsize=16, ttl=300.0)
+_generations = count()
+_list_generation = next(_generations)
 
-@schedules_bp.route('/irrigation', methods=['POST'])
-def create_irrigation_schedule():
-    """Create a new irrigation schedule."""
-    try:
-        data = request.get_json()
-        
-        if not data or not all(k in data for k in ['day_of_week', 'time']):
-            return jsonify({
-                'success': False,
-                'error': 'day_of_week and time are required'
-            }), 400
-        
-        db = next(get_db())
-        
-        # Parse time string (HH:MM:SS or HH:MM)
-        time_str = data['time']
-        time_parts = time_str.split(':')
-        schedule_time = dt_time(int(time_parts[0]), int(time_parts[1]), int(time_parts[2]) if len(time_parts) > 2 else 0)
-        
-        schedule = IrrigationSchedule(
-            zone_id=ZONE_ID,
-            day_of_week=data['day_of_week'],
-            time=schedule_time,
-            enabled=data.get('enabled', True)
-        )
-        
-        db.add(schedule)
-        db.commit()
-        schedule_id = schedule.id
-        db.close()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Irrigation schedule created',
-            'id': schedule_id
-        }), 201
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
 
+def _invalidate_lists(*args):
+    """Drop cached schedule lists."""
+    global _list_generation
+    _list_generation = next(_generations)
+    _list_cache.invalidate()
 
-@schedules_bp.route('/irrigation/<int:schedule_id>', methods=['PUT'])
-def update_irrigation_schedule(schedule_id):
-    """Update an irrigation schedule."""
-    try:
-        data = request.get_json()
-        db = next(get_db())
-        
-        schedule = db.query(IrrigationSchedule).filter_by(id=schedule_id).first()
-        if not schedule:
-            db.close()
-            return jsonify({
-                'success': False,
-                'error': 'Schedule not found'
-            }), 404
-        
-        # zone_id is always ZONE_ID (hardcoded to 1)
-        schedule.zone_id = ZONE_ID
-        if 'day_of_week' in data:
-            schedule.day_of_week = data['day_of_week']
-        if 'time' in data:
-            time_str = data['time']
-            time_parts = time_str.split(':')
-            schedule.time = dt_time(int(time_parts[0]), int(time_parts[1]), int(time_parts[2]) if len(time_parts) > 2 else 0)
-        if 'enabled' in data:
-            schedule.enabled = data['enabled']
-        
-        db.commit()
-        db.close()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Schedule updated'
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
 
+def _mark_lists_changed(mapper, connection, target):
+    """
+    Flag the flushing session so its commit invalidates the lists.
+    
+    Mapper events fire at flush, before the change is visible to other
+    sessions; invalidating there would let a list query that runs before the
+    commit cache pre-commit rows under the new generation.
+    """
+    session = object_session(target)
+    if session is not None:
+        session.info['schedule_lists_changed'] = True
 
-@schedules_bp.route('/irrigation/<int:schedule_id>', methods=['DELETE'])
-def delete_irrigation_schedule(schedule_id):
-    """Delete an irrigation schedule."""
-    try:
-        db = next(get_db())
-        schedule = db.query(IrrigationSchedule).filter_by(id=schedule_id).first()
-        
-        if not schedule:
-            db.close()
-            return jsonify({
-                'success': False,
-                'error': 'Schedule not found'
-            }), 404
-        
-        db.delete(schedule)
-        db.commit()
-        db.close()
-        
-        return jsonify({
-            'success': True,
-            'message': 'Schedule deleted'
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
 
+@event.listens_for(Session, 'after_commit')
+def _invalidate_lists_after_commit(session):
+    if session.info.pop('schedule_lists_changed', False):
+        _invalidate_lists()
 
-# Fertigation schedules (similar endpoints)
-@schedules_bp.route('/fertigation', methods=['GET'])
-def list_fertigation_schedules():
-    """List all fertigation schedules."""
-    try:
-        db = next(get_db())
-        schedules = db.query(FertigationSchedule).all()
-        
-        result = [{
-            'id': s.id,
-            'zone_id': s.zone_id,
-            'day_of_week': s.day_of_week,
-            'time': s.time.strftime('%H:%M:%S') if s.time else None,
-            'enabled': s.enabled,
-            'last_run': s.last_run.isoformat() if s.last_run else None
-        } for s in schedules]
-        
-        db.close()
-        return jsonify({
-            'success': True,
-            'schedules': result
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_list_changes(session):
+    session.info.pop('schedule_lists_changed', None)
 
 
-@schedules_bp.route('/fertigation', methods=['POST'])
-def create_fertigation_schedule():
-    """Create a new fertigation schedule."""
+@lru_cache(maxsize=512)
+def _parse_time(time_str: str) -> dt_time:
+    """Parse an ``HH:MM:SS`` or ``HH:MM`` schedule time."""
     try:
+        return datetime.strptime(time_str, '%H:%M:%S').time()
+    except ValueError:
+        return datetime.strptime(time_str, '%H:%M').time()
+
+
+def _stream_schedules(db, model):
+    """
+    Run the schedule list query and return a generator of JSON body chunks.
+    
+    Rows are fetched as plain column tuples in batches of 500 and encoded one
+    batch at a time, so memory stays flat regardless of table size. ``time``
+    and ``last_run`` are rendered by orjson as ``HH:MM:SS`` and ISO 8601.
+    The query executes before this returns, so SQL errors still surface to
+    the caller as a normal 500.
+    """
+    result = db.execute(
+        select(*attrgetter(*_SCHEDULE_FIELDS)(model))
+        .order_by(model.zone_id, model.day_of_week, model.time)
+        .execution_options(yield_per=500)
+    )
+
+    def generate():
+        yield b'{"success":true,"schedules":['
+        separator = b''
+        for rows in result.partitions():
+            yield separator + b','.join(dumps(dict(zip(_SCHEDULE_FIELDS, row))) for row in rows)
+            separator = b','
+        yield b']}'
+
+    return generate()
+
+
+def _caching(chunks, cache_key, generation):
+    """
+    Pass body chunks through and cache the joined body once fully streamed.
+    
+    ``generation`` is the list generation read before the query ran; the body
+    is only stored if no schedule changed since then.
+    """
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    if generation == _list_generation:
+        _list_cache.set(cache_key, b''.join(parts))
+
+
+def register_schedule_crud(bp: Blueprint, model, prefix: str):
+    """
+    Register list/create/update/delete endpoints for a schedule model.
+    
+    Irrigation and fertigation schedules share one table shape, so both sets
+    of routes are built from the same closures over ``model``.
+    
+    Args:
+        bp: Blueprint to register the routes on
+        model: Schedule model class (IrrigationSchedule or FertigationSchedule)
+        prefix: URL prefix such as '/irrigation'; its name also suffixes the
+            endpoint names
+    
+    Returns:
+        Tuple of the (list, create, update, delete) view functions
+    """
+    kind = prefix.strip('/')
+    created_message = f'{kind.capitalize()} schedule created'
+
+    def list_schedules():
+        """List all schedules of this kind."""
+        cache_key = _list_cache.request_key()
+        cached = _list_cache.get(cache_key)
+        if cached is not None:
+            return conditional_response(*cached)
+        
+        # Read before the query so a change committed while it runs keeps the
+        # (possibly stale) body out of the cache
+        generation = _list_generation
+        db = SessionLocal()
+        chunks = _caching(_stream_schedules(db, model), cache_key, generation)
+        
+        return Response(stream_with_context(chunks), status=200, mimetype='application/json')
+
+    def create_schedule():
+        """Create a new schedule, or several at once from an ``items`` list."""
         data = request.get_json()
+        if isinstance(data, dict) and 'items' in data:
+            return _create_many(data['items'])
+        try:
+            day_of_week = data['day_of_week']
+            time_str = data['time']
+        except (KeyError, TypeError):
+            return json_response(_MISSING_FIELDS_BODY, 400)
         
-        if not data or not all(k in data for k in ['day_of_week', 'time']):
-            return jsonify({
-                'success': False,
-                'error': 'day_of_week and time are required'
-            }), 400
-        
-        db = next(get_db())
-        
-        time_str = data['time']
-        time_parts = time_str.split(':')
-        schedule_time = dt_time(int(time_parts[0]), int(time_parts[1]), int(time_parts[2]) if len(time_parts) > 2 else 0)
+        db = SessionLocal()
         
-        schedule = FertigationSchedule(
-            zone_id=ZONE_ID,
-            day_of_week=data['day_of_week'],
-            time=schedule_time,
-            enabled=data.get('enabled', True)
-        )
+        schedule_time = _parse_time(time_str)
         
-        db.add(schedule)
+        schedule_id = db.execute(
+            insert(model).values(
+                zone_id=ZONE_ID,
+                day_of_week=day_of_week,
+                time=schedule_time,
+                enabled=data.get('enabled', True)
+            ).returning(model.id)
+        ).scalar_one()
         db.commit()
-        schedule_id = schedule.id
-        db.close()
+        _invalidate_lists()
         
-        return jsonify({
+        return ojson({
             'success': True,
-            'message': 'Fertigation schedule created',
+            'message': created_message,
             'id': schedule_id
-        }), 201
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        }, 201)
 
+    def _create_many(items):
+        try:
+            rows = [{
+                'zone_id': ZONE_ID,
+                'day_of_week': item['day_of_week'],
+                'time': _parse_time(item['time']),
+                'enabled': item.get('enabled', True)
+            } for item in items]
+        except (KeyError, TypeError, AttributeError):
+            return json_response(_MISSING_FIELDS_BODY, 400)
 
-@schedules_bp.route('/fertigation/<int:schedule_id>', methods=['PUT'])
-def update_fertigation_schedule(schedule_id):
-    """Update a fertigation schedule."""
-    try:
+        ids = []
+        if rows:
+            db = SessionLocal()
+            # executemany form: SQLAlchemy batches the rows into multi-row
+            # INSERT ... RETURNING statements instead of one round-trip per row
+            result = db.execute(
+                insert(model).returning(model.id, sort_by_parameter_order=True),
+                rows
+            )
+            ids = result.scalars().all()
+            db.commit()
+            _invalidate_lists()
+
+        return ojson({
+            'success': True,
+            'message': created_message,
+            'ids': ids
+        }, 201)
+
+    def update_schedule(schedule_id):
+        """Update a schedule."""
         data = request.get_json()
-        db = next(get_db())
-        
-        schedule = db.query(FertigationSchedule).filter_by(id=schedule_id).first()
-        if not schedule:
-            db.close()
-            return jsonify({
-                'success': False,
-                'error': 'Schedule not found'
-            }), 404
+        db = SessionLocal()
         
         # zone_id is always ZONE_ID (hardcoded to 1)
-        schedule.zone_id = ZONE_ID
+        changes = {'zone_id': ZONE_ID}
         if 'day_of_week' in data:
-            schedule.day_of_week = data['day_of_week']
+            changes['day_of_week'] = data['day_of_week']
         if 'time' in data:
-            time_str = data['time']
-            time_parts = time_str.split(':')
-            schedule.time = dt_time(int(time_parts[0]), int(time_parts[1]), int(time_parts[2]) if len(time_parts) > 2 else 0)
+            changes['time'] = _parse_time(data['time'])
         if 'enabled' in data:
-            schedule.enabled = data['enabled']
+            changes['enabled'] = data['enabled']
         
+        # Single UPDATE; rowcount tells us whether the schedule exists
+        result = db.execute(
+            update(model).where(model.id == schedule_id).values(**changes)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            db.rollback()
+            return json_response(_NOT_FOUND_BODY, 404)
         db.commit()
-        db.close()
+        _invalidate_lists()
         
-        return jsonify({
+        return ojson({
             'success': True,
             'message': 'Schedule updated'
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        }, 200)
 
-
-@schedules_bp.route('/fertigation/<int:schedule_id>', methods=['DELETE'])
-def delete_fertigation_schedule(schedule_id):
-    """Delete a fertigation schedule."""
-    try:
-        db = next(get_db())
-        schedule = db.query(FertigationSchedule).filter_by(id=schedule_id).first()
-        
-        if not schedule:
-            db.close()
-            return jsonify({
-                'success': False,
-                'error': 'Schedule not found'
-            }), 404
-        
-        db.delete(schedule)
+    def delete_schedule(schedule_id):
+        """Delete a schedule."""
+        db = SessionLocal()
+        result = db.execute(
+            delete(model).where(model.id == schedule_id)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            db.rollback()
+            return json_response(_NOT_FOUND_BODY, 404)
         db.commit()
-        db.close()
+        _invalidate_lists()
         
-        return jsonify({
+        return ojson({
             'success': True,
             'message': 'Schedule deleted'
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        }, 200)
+
+    # The scheduler updates last_run through the ORM unit of work; the lists
+    # are invalidated once that session commits
+    for identifier in ('after_insert', 'after_update', 'after_delete'):
+        event.listen(model, identifier, _mark_lists_changed)
+
+    # Keep the original endpoint names (e.g. schedules.list_irrigation_schedules).
+    # strict_slashes=False so '/irrigation/' matches without a redirect even when
+    # the blueprint is mounted on an app that keeps Werkzeug's default.
+    views = (
+        (prefix, f'list_{kind}_schedules', list_schedules, 'GET'),
+        (prefix, f'create_{kind}_schedule', create_schedule, 'POST'),
+        (f'{prefix}/<int:schedule_id>', f'update_{kind}_schedule', update_schedule, 'PUT'),
+        (f'{prefix}/<int:schedule_id>', f'delete_{kind}_schedule', delete_schedule, 'DELETE'),
+    )
+    for rule, endpoint, view, method in views:
+        view.__name__ = view.__qualname__ = endpoint
+        bp.add_url_rule(rule, endpoint, view, methods=[method], strict_slashes=False)
+
+    return list_schedules, create_schedule, update_schedule, delete_schedule
+
 
+register_schedule_crud(schedules_bp, IrrigationSchedule, '/irrigation')
+register_schedule_crud(schedules_bp, FertigationSchedule, '/fertigation')
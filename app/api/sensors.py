@@ -1,145 +1,334 @@
 """Sensor data API endpoints."""
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, request
 from app.api import api_bp
+from app.api.responses import ojson, dumps, json_response
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 from datetime import datetime
-from app.config.config import USE_MOCK_HARDWARE
+from app.config.config import USE_MOCK_HARDWARE, SENSOR_CACHE_TTL_SEC
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Optional, Union
+import msgspec
+
+logger = logging.getLogger(__name__)
 
 sensors_bp = Blueprint('sensors', __name__)
 api_bp.register_blueprint(sensors_bp, url_prefix='/sensors')
 
+_MOCK_DISABLED_BODY = dumps({'success': False, 'error': 'Mock hardware is not enabled. This endpoint only works in mock mode.'})
+_NO_ADC_BODY = dumps({'success': False, 'error': 'ADC instance not available'})
+_NO_GPIO_BODY = dumps({'success': False, 'error': 'GPIO instance not available'})
+_NO_HARDWARE_BODY = dumps({'success': False, 'error': 'Hardware instances not available'})
+_NO_BODY_BODY = dumps({'success': False, 'error': 'Request body is required'})
+_ADC_FIELDS_REQUIRED_BODY = dumps({'success': False, 'error': 'Both "channel" (0-3) and "value" (0.0-1.0) are required'})
+_GPIO_FIELDS_REQUIRED_BODY = dumps({'success': False, 'error': 'Both "pin" and "value" (0.0-1.0) are required'})
+_NO_SENSOR_TYPE_BODY = dumps({'success': False, 'error': 'sensor_type is required'})
+_MOISTURE_REQUIRED_BODY = dumps({'success': False, 'error': 'moisture_percent (0-100) is required for soil moisture sensors'})
+_MOISTURE_RANGE_BODY = dumps({'success': False, 'error': 'moisture_percent must be between 0 and 100'})
+_PRESSURE_REQUIRED_BODY = dumps({'success': False, 'error': 'pressure_kpa is required for pressure sensors'})
+_LEVEL_REQUIRED_BODY = dumps({'success': False, 'error': 'level_cm is required (sensor distance in cm: 10 = full, 100 = empty)'})
+
 # Global sensors dictionary (will be initialized in main.py)
 sensors_dict = {}
 
+# Frozen (key, sensor) pairs iterated by /current; see freeze_sensors()
+_sensors_snapshot = None
+
+# Serialized /mock/status body; built on first request, reset by freeze_sensors()
+_mock_status_body = None
+
 # Global hardware instances for mock value control (will be initialized in main.py)
 adc_instance = None
 gpio_instance = None
 
 
-@sensors_bp.route('/current', methods=['GET'])
-def get_current_sensor_readings():
-    """Get current readings from all sensors."""
+def freeze_sensors():
+    """
+    Snapshot sensors_dict for the /current endpoint.
+    
+    Sensors are registered once at startup, so main.py calls this after
+    setting sensors_dict and requests iterate a tuple instead of the dict.
+    Until it is called (e.g. tests that swap sensors_dict) the live dict is used.
+    """
+    global _sensors_snapshot, _mock_status_body
+    _sensors_snapshot = tuple(sensors_dict.items())
+    _mock_status_body = None
+    _mock_affine.clear()
+
+
+# Sensor reads block on I2C/GPIO, so /current fans them out and costs roughly
+# the slowest read instead of the sum of all reads
+SENSOR_READ_TIMEOUT_SEC = 2.0
+_read_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='sensor-read')
+
+
+def _run_inline(fn, *args) -> Future:
+    """Run fn on the calling thread and wrap the outcome in a completed Future."""
+    future = Future()
     try:
-        readings = []
-        
-        # Debug: Log available sensors
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"Available sensors in sensors_dict: {list(sensors_dict.keys())}")
-        
-        # Read from all sensors
-        for sensor_key, sensor in sensors_dict.items():
-            try:
-                # Always read fresh value from sensor for real-time monitoring
-                reading = sensor.read_standardized()
-                
-                # Format reading for API response
-                reading_data = {
-                    'sensor_id': reading.get('sensor_id', sensor_key),
-                    'sensor_type': sensor_key,
-                    'zone_id': reading.get('zone_id'),
-                    'value': reading.get('value'),
-                    'unit': reading.get('unit'),
-                    'raw_value': reading.get('raw_value'),
-                    'raw_unit': reading.get('raw_unit'),
-                    'timestamp': reading.get('timestamp').isoformat() if reading.get('timestamp') else datetime.now().isoformat(),
-                    'is_healthy': sensor.is_sensor_healthy()
-                }
-                
-                # Add percentage value if available (for tank level)
-                if 'value_percent' in reading:
-                    reading_data['value_percent'] = reading.get('value_percent')
-                
-                readings.append(reading_data)
-            except Exception as e:
-                # If sensor read fails, include error info but still show the sensor
-                logger.warning(f"Failed to read sensor {sensor_key}: {str(e)}")
-                readings.append({
-                    'sensor_id': sensor_key,
-                    'sensor_type': sensor_key,
-                    'zone_id': getattr(sensor, 'zone_id', None),
-                    'error': str(e),
-                    'is_healthy': False,
-                    'timestamp': datetime.now().isoformat()
-                })
-        
-        logger.info(f"Returning {len(readings)} sensor readings")
-        return jsonify({
-            'success': True,
-            'readings': readings,
-            'count': len(readings),
-            'timestamp': datetime.now().isoformat()
-        }), 200
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+# Mock sensors read from memory, where a thread hand-off costs more than the
+# read itself, so only real hardware reads go through the pool
+_submit_read = _run_inline if USE_MOCK_HARDWARE else _read_pool.submit
+
+
+class SensorReading(msgspec.Struct):
+    """Serialized shape of a single sensor reading in API responses."""
+    sensor_id: Any
+    sensor_type: str
+    zone_id: Optional[int]
+    value: Optional[float]
+    unit: Optional[str]
+    raw_value: Optional[float]
+    raw_unit: Optional[str]
+    timestamp: Any
+    is_healthy: bool
+    # Only present for sensors that report it (tank level)
+    value_percent: Union[Optional[float], msgspec.UnsetType] = msgspec.UNSET
+
+
+class SensorReadingError(msgspec.Struct):
+    """Serialized shape of a sensor whose read failed."""
+    sensor_id: str
+    sensor_type: str
+    zone_id: Optional[int]
+    error: str
+    is_healthy: bool
+    timestamp: Any
+
+
+def _enc_hook(obj):
+    # numpy scalars and other numeric types coming out of sensor math
+    try:
+        return float(obj)
+    except (TypeError, ValueError):
+        raise NotImplementedError(f'Cannot serialize {type(obj).__name__}')
+
+
+_json_encoder = msgspec.json.Encoder(enc_hook=_enc_hook)
+
+_NDJSON_MIMETYPE = 'application/x-ndjson'
+# JSON first so */* and missing Accept headers keep the regular response
+_CURRENT_MIMETYPES = ('application/json', _NDJSON_MIMETYPE)
+
+
+# Reading keys copied straight through, in SensorReading field order
+_PASSTHROUGH_KEYS = ('zone_id', 'value', 'unit', 'raw_value', 'raw_unit')
+
+
+def _to_sensor_reading(sensor_key, reading, is_healthy, now) -> SensorReading:
+    get = reading.get
+    return SensorReading(
+        get('sensor_id', sensor_key),
+        sensor_key,
+        *map(get, _PASSTHROUGH_KEYS),
+        get('timestamp') or now,
+        is_healthy,
+        get('value_percent', msgspec.UNSET)
+    )
+
+
+# Short-lived readings shared by requests polling within SENSOR_CACHE_TTL_SEC
+_reading_cache = {}  # sensor_key -> (expires_at, reading, is_healthy)
+_reading_locks = defaultdict(threading.Lock)
+_reading_locks_guard = threading.Lock()
+
+
+def _cached_reading(sensor_key):
+    cached = _reading_cache.get(sensor_key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1], cached[2]
+    return None
+
+
+def _read_sensor(sensor_key, sensor):
+    """
+    Read a sensor and its health flag, reusing a recent reading if available.
+    
+    Concurrent requests for the same sensor wait on a per-sensor lock and
+    share one bus transaction instead of each reading the hardware.
+    
+    Args:
+        sensor_key: Key of the sensor in sensors_dict
+        sensor: Sensor instance
         
+    Returns:
+        Tuple of (standardized reading, is_healthy)
+    """
+    cached = _cached_reading(sensor_key)
+    if cached is not None:
+        return cached
+    with _reading_locks_guard:
+        key_lock = _reading_locks[sensor_key]
+    with key_lock:
+        cached = _cached_reading(sensor_key)
+        if cached is not None:
+            return cached
+        reading = sensor.read_standardized()
+        is_healthy = sensor.is_sensor_healthy()
+        _reading_cache[sensor_key] = (time.monotonic() + SENSOR_CACHE_TTL_SEC, reading, is_healthy)
+        return reading, is_healthy
+
+
+def _collect_reading(sensor_key, sensor, future, timeout, now):
+    """
+    Wait up to timeout seconds for a sensor read and build its response entry.
+    
+    A failed or timed-out read becomes a SensorReadingError so the sensor is
+    still listed in the response.
+    """
+    try:
+        reading, is_healthy = future.result(timeout=timeout)
+        return _to_sensor_reading(sensor_key, reading, is_healthy, now)
     except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        if isinstance(e, FuturesTimeoutError):
+            error = f'Sensor read timed out after {SENSOR_READ_TIMEOUT_SEC}s'
+        else:
+            error = str(e)
+        logger.warning("Failed to read sensor %s: %s", sensor_key, error)
+        return SensorReadingError(
+            sensor_id=sensor_key,
+            sensor_type=sensor_key,
+            zone_id=sensor.zone_id,
+            error=error,
+            is_healthy=False,
+            timestamp=now
+        )
+
+
+def _stream_readings(futures, now):
+    """
+    Yield one JSON line per sensor in completion order.
+    
+    Fast sensors are sent as soon as they finish instead of waiting for the
+    slowest read; sensors still pending at the deadline are reported as
+    timed out.
+    """
+    pending = {future: (sensor_key, sensor) for sensor_key, sensor, future in futures}
+    try:
+        for future in as_completed(pending, timeout=SENSOR_READ_TIMEOUT_SEC):
+            sensor_key, sensor = pending.pop(future)
+            yield _json_encoder.encode(_collect_reading(sensor_key, sensor, future, 0, now)) + b'\n'
+    except FuturesTimeoutError:
+        pass
+    for future, (sensor_key, sensor) in pending.items():
+        yield _json_encoder.encode(_collect_reading(sensor_key, sensor, future, 0, now)) + b'\n'
+
+
+@sensors_bp.route('/current', methods=['GET'])
+def get_current_sensor_readings():
+    """
+    Get current readings from all sensors.
+    
+    Clients that prefer ``application/x-ndjson`` in their Accept header get
+    one reading object per line, streamed as each sensor read completes.
+    """
+    now = datetime.now()
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Available sensors in sensors_dict: %s", list(sensors_dict))
+    
+    # Read from all sensors concurrently
+    futures = [
+        (sensor_key, sensor, _submit_read(_read_sensor, sensor_key, sensor))
+        for sensor_key, sensor in (_sensors_snapshot if _sensors_snapshot is not None
+                                   else sensors_dict.items())
+    ]
+    
+    if request.accept_mimetypes.best_match(_CURRENT_MIMETYPES) == _NDJSON_MIMETYPE:
+        return Response(_stream_readings(futures, now), status=200, mimetype=_NDJSON_MIMETYPE)
+    
+    # Results are collected in sensors_dict order so the response shape stays stable
+    deadline = time.monotonic() + SENSOR_READ_TIMEOUT_SEC
+    readings = [
+        _collect_reading(sensor_key, sensor, future, max(0.0, deadline - time.monotonic()), now)
+        for sensor_key, sensor, future in futures
+    ]
+    
+    logger.debug("Returning %d sensor readings", len(readings))
+    return json_response(_json_encoder.encode({
+        'success': True,
+        'readings': readings,
+        'count': len(readings),
+        'timestamp': now
+    }), 200)
 
 
 @sensors_bp.route('/current/<sensor_type>', methods=['GET'])
 def get_current_sensor_reading(sensor_type):
     """Get current reading from a specific sensor type."""
+    sensor = sensors_dict.get(sensor_type)
+    
+    if sensor is None:
+        return ojson({
+            'success': False,
+            'error': f'Sensor type {sensor_type} not found'
+        }, 404)
+    
     try:
-        sensor = sensors_dict.get(sensor_type)
-        
-        if sensor is None:
-            return jsonify({
-                'success': False,
-                'error': f'Sensor type {sensor_type} not found'
-            }), 404
+        reading, is_healthy = _read_sensor(sensor_type, sensor)
         
-        try:
-            # Always read fresh value from sensor for real-time monitoring
-            reading = sensor.read_standardized()
-            
-            # Format reading for API response
-            reading_data = {
-                'sensor_id': reading.get('sensor_id', sensor_type),
-                'sensor_type': sensor_type,
-                'zone_id': reading.get('zone_id'),
-                'value': reading.get('value'),
-                'unit': reading.get('unit'),
-                'raw_value': reading.get('raw_value'),
-                'raw_unit': reading.get('raw_unit'),
-                'timestamp': reading.get('timestamp').isoformat() if reading.get('timestamp') else datetime.now().isoformat(),
-                'is_healthy': sensor.is_sensor_healthy()
-            }
-            
-            # Add percentage value if available (for tank level)
-            if 'value_percent' in reading:
-                reading_data['value_percent'] = reading.get('value_percent')
-            
-            return jsonify({
-                'success': True,
-                'reading': reading_data
-            }), 200
-            
-        except Exception as e:
-            return jsonify({
-                'success': False,
-                'error': f'Failed to read sensor {sensor_type}: {str(e)}',
-                'is_healthy': False
-            }), 500
+        return json_response(_json_encoder.encode({
+            'success': True,
+            'reading': _to_sensor_reading(sensor_type, reading, is_healthy, datetime.now())
+        }), 200)
         
     except Exception as e:
-        return jsonify({
+        return ojson({
             'success': False,
-            'error': str(e)
-        }), 500
+            'error': f'Failed to read sensor {sensor_type}: {str(e)}',
+            'is_healthy': False
+        }, 500)
+
+
+# Mock-endpoint field rules: (name, accepted types, minimum, maximum or None, error)
+_ADC_CHANNEL_RULES = (
+    ('channel', int, 0, 3, 'Channel must be an integer between 0 and 3'),
+    ('value', (int, float), 0.0, 1.0, 'Value must be a number between 0.0 and 1.0'),
+)
+_GPIO_PIN_RULES = (
+    ('pin', int, 0, None, 'Pin must be a non-negative integer'),
+    ('value', (int, float), 0.0, 1.0, 'Value must be a number between 0.0 and 1.0'),
+)
+
+
+def _missing_field(data, rules) -> bool:
+    """Return True if any field named in rules is absent or null."""
+    return any(data.get(rule[0]) is None for rule in rules)
+
+
+def _invalid_field_error(data, rules) -> Optional[str]:
+    """Return the error of the first field outside its type/range rule, or None."""
+    for name, types, minimum, maximum, error in rules:
+        value = data[name]
+        if not isinstance(value, types) or value < minimum or (maximum is not None and value > maximum):
+            return error
+    return None
 
 
 @sensors_bp.route('/mock/status', methods=['GET'])
 def get_mock_status():
     """Get status of mock hardware system."""
-    return jsonify({
-        'success': True,
-        'mock_hardware_enabled': USE_MOCK_HARDWARE,
-        'adc_available': adc_instance is not None,
-        'gpio_available': gpio_instance is not None,
-        'available_sensors': list(sensors_dict.keys()),
-        'note': 'Use /mock/set_sensor_value to set sensor values, or /mock/set_adc_channel and /mock/set_gpio_pin for direct control'
-    }), 200
+    global _mock_status_body
+    # Sensors and hardware instances are wired once at startup, so the
+    # payload only changes when freeze_sensors() runs again
+    if _mock_status_body is None:
+        _mock_status_body = dumps({
+            'success': True,
+            'mock_hardware_enabled': USE_MOCK_HARDWARE,
+            'adc_available': adc_instance is not None,
+            'gpio_available': gpio_instance is not None,
+            'available_sensors': tuple(sensors_dict),
+            'note': 'Use /mock/set_sensor_value to set sensor values, or /mock/set_adc_channel and /mock/set_gpio_pin for direct control'
+        })
+    return json_response(_mock_status_body, 200)
 
 
 @sensors_bp.route('/mock/set_adc_channel', methods=['POST'])
@@ -155,61 +344,38 @@ def set_mock_adc_channel():
     }
     """
     if not USE_MOCK_HARDWARE:
-        return jsonify({
-            'success': False,
-            'error': 'Mock hardware is not enabled. This endpoint only works in mock mode.'
-        }), 400
+        return json_response(_MOCK_DISABLED_BODY, 400)
     
     if adc_instance is None:
-        return jsonify({
-            'success': False,
-            'error': 'ADC instance not available'
-        }), 500
+        return json_response(_NO_ADC_BODY, 500)
     
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'Request body is required'
-            }), 400
-        
-        channel = data.get('channel')
-        value = data.get('value')
-        
-        if channel is None or value is None:
-            return jsonify({
-                'success': False,
-                'error': 'Both "channel" (0-3) and "value" (0.0-1.0) are required'
-            }), 400
-        
-        if not isinstance(channel, int) or channel < 0 or channel > 3:
-            return jsonify({
-                'success': False,
-                'error': 'Channel must be an integer between 0 and 3'
-            }), 400
-        
-        if not isinstance(value, (int, float)) or value < 0.0 or value > 1.0:
-            return jsonify({
-                'success': False,
-                'error': 'Value must be a number between 0.0 and 1.0'
-            }), 400
-        
-        # Set the mock value
-        adc_instance.set_mock_value(channel, float(value))
-        
-        return jsonify({
-            'success': True,
-            'message': f'Mock value set for ADC channel {channel}',
-            'channel': channel,
-            'value': float(value)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
+    data = request.get_json()
+    if not data:
+        return json_response(_NO_BODY_BODY, 400)
+    
+    if _missing_field(data, _ADC_CHANNEL_RULES):
+        return json_response(_ADC_FIELDS_REQUIRED_BODY, 400)
+    
+    error = _invalid_field_error(data, _ADC_CHANNEL_RULES)
+    if error:
+        return ojson({
             'success': False,
-            'error': str(e)
-        }), 500
+            'error': error
+        }, 400)
+    
+    channel = data['channel']
+    value = data['value']
+    
+    # Set the mock value
+    adc_instance.set_mock_value(channel, float(value))
+    _reading_cache.clear()
+    
+    return ojson({
+        'success': True,
+        'message': f'Mock value set for ADC channel {channel}',
+        'channel': channel,
+        'value': float(value)
+    }, 200)
 
 
 @sensors_bp.route('/mock/set_gpio_pin', methods=['POST'])
@@ -225,61 +391,164 @@ def set_mock_gpio_pin():
     }
     """
     if not USE_MOCK_HARDWARE:
-        return jsonify({
-            'success': False,
-            'error': 'Mock hardware is not enabled. This endpoint only works in mock mode.'
-        }), 400
+        return json_response(_MOCK_DISABLED_BODY, 400)
     
     if gpio_instance is None:
-        return jsonify({
+        return json_response(_NO_GPIO_BODY, 500)
+    
+    data = request.get_json()
+    if not data:
+        return json_response(_NO_BODY_BODY, 400)
+    
+    if _missing_field(data, _GPIO_PIN_RULES):
+        return json_response(_GPIO_FIELDS_REQUIRED_BODY, 400)
+    
+    error = _invalid_field_error(data, _GPIO_PIN_RULES)
+    if error:
+        return ojson({
             'success': False,
-            'error': 'GPIO instance not available'
-        }), 500
+            'error': error
+        }, 400)
     
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'Request body is required'
-            }), 400
-        
-        pin = data.get('pin')
-        value = data.get('value')
-        
-        if pin is None or value is None:
-            return jsonify({
-                'success': False,
-                'error': 'Both "pin" and "value" (0.0-1.0) are required'
-            }), 400
-        
-        if not isinstance(pin, int) or pin < 0:
-            return jsonify({
-                'success': False,
-                'error': 'Pin must be a non-negative integer'
-            }), 400
-        
-        if not isinstance(value, (int, float)) or value < 0.0 or value > 1.0:
-            return jsonify({
-                'success': False,
-                'error': 'Value must be a number between 0.0 and 1.0'
-            }), 400
-        
-        # Set the mock value
-        gpio_instance.set_analog_value(pin, float(value))
-        
-        return jsonify({
-            'success': True,
-            'message': f'Mock value set for GPIO pin {pin}',
-            'pin': pin,
-            'value': float(value)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
+    pin = data['pin']
+    value = data['value']
+    
+    # Set the mock value
+    gpio_instance.set_analog_value(pin, float(value))
+    _reading_cache.clear()
+    
+    return ojson({
+        'success': True,
+        'message': f'Mock value set for GPIO pin {pin}',
+        'pin': pin,
+        'value': float(value)
+    }, 200)
+
+
+# sensor_type -> (scale, offset) mapping a mock input to the normalized value;
+# calibration is fixed per sensor, so each pair is derived once
+_mock_affine = {}
+
+
+def _mock_scale_offset(sensor_type, x0, y0, x1, y1):
+    """
+    Return (scale, offset) of the line through (x0, y0) and (x1, y1).
+    
+    An empty or inverted input range maps every input to 0.5.
+    """
+    affine = _mock_affine.get(sensor_type)
+    if affine is None:
+        span = x1 - x0
+        if span > 0:
+            scale = (y1 - y0) / span
+            affine = (scale, y0 - scale * x0)
+        else:
+            affine = (0.0, 0.5)
+        _mock_affine[sensor_type] = affine
+    return affine
+
+
+def _set_mock_soil_moisture(sensor_type, sensor, data):
+    """Set a soil moisture sensor from ``moisture_percent``."""
+    moisture_percent = data.get('moisture_percent')
+    if moisture_percent is None:
+        return json_response(_MOISTURE_REQUIRED_BODY, 400)
+    
+    moisture_percent = float(moisture_percent)
+    if moisture_percent < 0 or moisture_percent > 100:
+        return json_response(_MOISTURE_RANGE_BODY, 400)
+    
+    # Convert moisture percentage to normalized value
+    # Formula: normalized = dry_value - (moisture_percent/100 * (dry_value - wet_value))
+    scale, offset = _mock_scale_offset(sensor_type, 0.0, sensor.dry_value, 100.0, sensor.wet_value)
+    normalized = scale * moisture_percent + offset
+    
+    # Set the ADC channel value
+    adc_instance.set_mock_value(sensor.channel, normalized)
+    _reading_cache.clear()
+    
+    return ojson({
+        'success': True,
+        'message': f'Soil moisture set to {moisture_percent:.1f}%',
+        'sensor_type': sensor_type,
+        'moisture_percent': moisture_percent,
+        'normalized_value': normalized,
+        'channel': sensor.channel
+    }, 200)
+
+
+def _set_mock_pressure(sensor_type, sensor, data):
+    """Set a pressure sensor from ``pressure_kpa``."""
+    pressure_kpa = data.get('pressure_kpa')
+    if pressure_kpa is None:
+        return json_response(_PRESSURE_REQUIRED_BODY, 400)
+    
+    pressure_kpa = float(pressure_kpa)
+    if pressure_kpa < sensor.min_pressure_kpa or pressure_kpa > sensor.max_pressure_kpa:
+        return ojson({
+            'success': False,
+            'error': f'pressure_kpa must be between {sensor.min_pressure_kpa} and {sensor.max_pressure_kpa} kPa'
+        }, 400)
+    
+    # Convert pressure to normalized value
+    # Formula: normalized = (pressure - min_pressure) / (max_pressure - min_pressure)
+    scale, offset = _mock_scale_offset(sensor_type, sensor.min_pressure_kpa, 0.0,
+                                       sensor.max_pressure_kpa, 1.0)
+    normalized = scale * pressure_kpa + offset
+    
+    # Set the ADC channel value
+    adc_instance.set_mock_value(sensor.channel, normalized)
+    _reading_cache.clear()
+    
+    return ojson({
+        'success': True,
+        'message': f'Pressure set to {pressure_kpa:.1f} kPa',
+        'sensor_type': sensor_type,
+        'pressure_kpa': pressure_kpa,
+        'normalized_value': normalized,
+        'channel': sensor.channel
+    }, 200)
+
+
+def _set_mock_tank_level(sensor_type, sensor, data):
+    """Set the tank level sensor from ``level_cm``."""
+    # Only convention: 10 cm = 100% full, 100 cm = 0% empty. Accept level_cm = sensor distance (10-100).
+    fill_range = getattr(sensor, '_fill_range_cm', sensor.empty_distance_cm - sensor.full_distance_cm)
+    level_cm = data.get('level_cm')
+    if level_cm is None:
+        return json_response(_LEVEL_REQUIRED_BODY, 400)
+    distance_cm = float(level_cm)
+    if distance_cm == 0:
+        distance_cm = sensor.empty_distance_cm  # 100 cm
+    if distance_cm < sensor.full_distance_cm or distance_cm > sensor.empty_distance_cm:
+        return ojson({
             'success': False,
-            'error': str(e)
-        }), 500
+            'error': f'level_cm must be between {sensor.full_distance_cm} and {sensor.empty_distance_cm} cm (10 = 100%%, 100 = 0%%)'
+        }, 400)
+
+    scale, offset = _mock_scale_offset(sensor_type, sensor.full_distance_cm, 0.0,
+                                       sensor.full_distance_cm + fill_range, 1.0)
+    normalized = scale * distance_cm + offset
+    gpio_instance.set_analog_value(sensor.echo_pin, normalized)
+    _reading_cache.clear()
+
+    level_percent = ((sensor.empty_distance_cm - distance_cm) / fill_range * 100) if fill_range > 0 else 0
+    return ojson({
+        'success': True,
+        'message': f'Tank level set: {distance_cm:.1f} cm ({level_percent:.0f}%%)',
+        'sensor_type': sensor_type,
+        'value': distance_cm,
+        'value_percent': level_percent,
+        'note': '10 cm = 100%%, 100 cm = 0%%.'
+    }, 200)
+
+
+# Mock setters keyed by BaseSensor.family
+_MOCK_SETTERS = {
+    'soil_moisture': _set_mock_soil_moisture,
+    'pressure': _set_mock_pressure,
+    'tank_level': _set_mock_tank_level,
+}
 
 
 @sensors_bp.route('/mock/set_sensor_value', methods=['POST'])
@@ -309,146 +578,31 @@ def set_mock_sensor_value():
     }
     """
     if not USE_MOCK_HARDWARE:
-        return jsonify({
-            'success': False,
-            'error': 'Mock hardware is not enabled. This endpoint only works in mock mode.'
-        }), 400
+        return json_response(_MOCK_DISABLED_BODY, 400)
     
     if adc_instance is None or gpio_instance is None:
-        return jsonify({
+        return json_response(_NO_HARDWARE_BODY, 500)
+    
+    data = request.get_json()
+    if not data:
+        return json_response(_NO_BODY_BODY, 400)
+    
+    sensor_type = data.get('sensor_type')
+    if not sensor_type:
+        return json_response(_NO_SENSOR_TYPE_BODY, 400)
+    
+    sensor = sensors_dict.get(sensor_type)
+    if sensor is None:
+        return ojson({
             'success': False,
-            'error': 'Hardware instances not available'
-        }), 500
+            'error': f'Sensor type "{sensor_type}" not found'
+        }, 404)
     
-    try:
-        data = request.get_json()
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'Request body is required'
-            }), 400
-        
-        sensor_type = data.get('sensor_type')
-        if not sensor_type:
-            return jsonify({
-                'success': False,
-                'error': 'sensor_type is required'
-            }), 400
-        
-        sensor = sensors_dict.get(sensor_type)
-        if sensor is None:
-            return jsonify({
-                'success': False,
-                'error': f'Sensor type "{sensor_type}" not found'
-            }), 404
-        
-        # Handle different sensor types
-        if sensor_type.startswith('soil_moisture'):
-            # Soil moisture sensor - expects moisture_percent (0-100%)
-            moisture_percent = data.get('moisture_percent')
-            if moisture_percent is None:
-                return jsonify({
-                    'success': False,
-                    'error': 'moisture_percent (0-100) is required for soil moisture sensors'
-                }), 400
-            
-            moisture_percent = float(moisture_percent)
-            if moisture_percent < 0 or moisture_percent > 100:
-                return jsonify({
-                    'success': False,
-                    'error': 'moisture_percent must be between 0 and 100'
-                }), 400
-            
-            # Convert moisture percentage to normalized value
-            # Formula: normalized = dry_value - (moisture_percent/100 * (dry_value - wet_value))
-            dry_value = sensor.dry_value
-            wet_value = sensor.wet_value
-            normalized = dry_value - (moisture_percent / 100.0 * (dry_value - wet_value))
-            
-            # Set the ADC channel value
-            adc_instance.set_mock_value(sensor.channel, normalized)
-            
-            return jsonify({
-                'success': True,
-                'message': f'Soil moisture set to {moisture_percent:.1f}%',
-                'sensor_type': sensor_type,
-                'moisture_percent': moisture_percent,
-                'normalized_value': normalized,
-                'channel': sensor.channel
-            }), 200
-        
-        elif sensor_type.startswith('pressure'):
-            # Pressure sensor - expects pressure_kpa
-            pressure_kpa = data.get('pressure_kpa')
-            if pressure_kpa is None:
-                return jsonify({
-                    'success': False,
-                    'error': 'pressure_kpa is required for pressure sensors'
-                }), 400
-            
-            pressure_kpa = float(pressure_kpa)
-            if pressure_kpa < sensor.min_pressure_kpa or pressure_kpa > sensor.max_pressure_kpa:
-                return jsonify({
-                    'success': False,
-                    'error': f'pressure_kpa must be between {sensor.min_pressure_kpa} and {sensor.max_pressure_kpa} kPa'
-                }), 400
-            
-            # Convert pressure to normalized value
-            # Formula: normalized = (pressure - min_pressure) / (max_pressure - min_pressure)
-            pressure_range = sensor.max_pressure_kpa - sensor.min_pressure_kpa
-            normalized = (pressure_kpa - sensor.min_pressure_kpa) / pressure_range if pressure_range > 0 else 0.5
-            
-            # Set the ADC channel value
-            adc_instance.set_mock_value(sensor.channel, normalized)
-            
-            return jsonify({
-                'success': True,
-                'message': f'Pressure set to {pressure_kpa:.1f} kPa',
-                'sensor_type': sensor_type,
-                'pressure_kpa': pressure_kpa,
-                'normalized_value': normalized,
-                'channel': sensor.channel
-            }), 200
-        
-        elif sensor_type == 'tank_level':
-            # Only convention: 10 cm = 100% full, 100 cm = 0% empty. Accept level_cm = sensor distance (10-100).
-            fill_range = getattr(sensor, '_fill_range_cm', sensor.empty_distance_cm - sensor.full_distance_cm)
-            level_cm = data.get('level_cm')
-            if level_cm is None:
-                return jsonify({
-                    'success': False,
-                    'error': 'level_cm is required (sensor distance in cm: 10 = full, 100 = empty)'
-                }), 400
-            distance_cm = float(level_cm)
-            if distance_cm == 0:
-                distance_cm = sensor.empty_distance_cm  # 100 cm
-            if distance_cm < sensor.full_distance_cm or distance_cm > sensor.empty_distance_cm:
-                return jsonify({
-                    'success': False,
-                    'error': f'level_cm must be between {sensor.full_distance_cm} and {sensor.empty_distance_cm} cm (10 = 100%%, 100 = 0%%)'
-                }), 400
-
-            normalized = (distance_cm - sensor.full_distance_cm) / fill_range if fill_range > 0 else 0.5
-            gpio_instance.set_analog_value(sensor.echo_pin, normalized)
-
-            level_percent = ((sensor.empty_distance_cm - distance_cm) / fill_range * 100) if fill_range > 0 else 0
-            return jsonify({
-                'success': True,
-                'message': f'Tank level set: {distance_cm:.1f} cm ({level_percent:.0f}%%)',
-                'sensor_type': sensor_type,
-                'value': distance_cm,
-                'value_percent': level_percent,
-                'note': '10 cm = 100%%, 100 cm = 0%%.'
-            }), 200
-        
-        else:
-            return jsonify({
-                'success': False,
-                'error': f'Sensor type "{sensor_type}" does not support mock value setting via this endpoint. Use /mock/set_adc_channel or /mock/set_gpio_pin directly.'
-            }), 400
-        
-    except Exception as e:
-        return jsonify({
+    setter = _MOCK_SETTERS.get(sensor.family)
+    if setter is None:
+        return ojson({
             'success': False,
-            'error': str(e)
-        }), 500
+            'error': f'Sensor type "{sensor_type}" does not support mock value setting via this endpoint. Use /mock/set_adc_channel or /mock/set_gpio_pin directly.'
+        }, 400)
+    
+    return setter(sensor_type, sensor, data)
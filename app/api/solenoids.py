@@ -1,36 +1,34 @@
 """Solenoid status API endpoints."""
 from flask import Blueprint, jsonify, request
 from app.api import api_bp
+from app.api.responses import dumps, json_response
 from app.services.solenoid_state_manager import SolenoidStateManager
 from app.config.config import ZONE_ID
 
 solenoids_bp = Blueprint('solenoids', __name__)
 api_bp.register_blueprint(solenoids_bp, url_prefix='/solenoids')
 
+_NOT_INITIALIZED_BODY = dumps({'success': False, 'error': 'Solenoid state manager not initialized'})
+_IS_OPEN_REQUIRED_BODY = dumps({'success': False, 'error': 'is_open parameter is required (true or false)'})
+
 # Global state manager (will be initialized in main.py)
 state_manager: SolenoidStateManager = None
 # Optional valve controller for zone valve status (set in main.py)
 valve_controller = None
 
+# String values of is_open that mean "open"; anything else means closed
+_TRUTHY = frozenset({'true', '1', 'yes', 'on', 't', 'y'})
+
 
 @solenoids_bp.route('/status', methods=['GET'])
 def get_all_solenoid_status():
     """Get status of all solenoids and zone valve(s)."""
     try:
         if not state_manager:
-            return jsonify({
-                'success': False,
-                'error': 'Solenoid state manager not initialized'
-            }), 500
-        
-        states = state_manager.get_all_solenoid_states()
+            return json_response(_NOT_INITIALIZED_BODY, 500)
         
-        # Get detailed info for each solenoid
-        detailed_states = {}
-        for solenoid_name in states.keys():
-            info = state_manager.get_solenoid_info(solenoid_name)
-            if info:
-                detailed_states[solenoid_name] = info
+        # Detailed info for every solenoid in a single query
+        detailed_states = state_manager.get_all_solenoid_info()
         
         # Add zone valve status (read from valve controller; not stored in DB)
         if valve_controller is not None:
@@ -59,10 +57,7 @@ def get_solenoid_status(solenoid_name: str):
     """Get status of a specific solenoid."""
     try:
         if not state_manager:
-            return jsonify({
-                'success': False,
-                'error': 'Solenoid state manager not initialized'
-            }), 500
+            return json_response(_NOT_INITIALIZED_BODY, 500)
         
         info = state_manager.get_solenoid_info(solenoid_name)
         
@@ -89,23 +84,17 @@ def set_solenoid_status(solenoid_name: str):
     """Set status of a specific solenoid."""
     try:
         if not state_manager:
-            return jsonify({
-                'success': False,
-                'error': 'Solenoid state manager not initialized'
-            }), 500
+            return json_response(_NOT_INITIALIZED_BODY, 500)
         
         data = request.get_json() or {}
         is_open = data.get('is_open')
         
         if is_open is None:
-            return jsonify({
-                'success': False,
-                'error': 'is_open parameter is required (true or false)'
-            }), 400
+            return json_response(_IS_OPEN_REQUIRED_BODY, 400)
         
         # Convert to boolean
         if isinstance(is_open, str):
-            is_open = is_open.lower() in ('true', '1', 'yes', 'on')
+            is_open = is_open.strip().lower() in _TRUTHY
         else:
             is_open = bool(is_open)
         
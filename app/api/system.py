@@ -1,6 +1,8 @@
 """System control and configuration API endpoints."""
+import threading
 from flask import Blueprint, jsonify, request
 from app.api import api_bp
+from app.api.responses import ResponseCache, conditional_response, dumps, json_response
 from app.config.config import (
     ZONE_ID,
     ZONE_VALVE_GPIO_PIN,
@@ -12,30 +14,37 @@ from app.config.config import (
     MINOR_LOSS_COEFFICIENT_K,
     PRESSURE_SAFETY_MARGIN_PERCENT,
 )
-from app.config.database import get_db
+from app.config.database import session_scope
 from app.utils.system_config_helper import load_system_config, update_system_config
 from app.hydraulics.pressure_calculator import PressureCalculator
 
 system_bp = Blueprint('system', __name__)
 api_bp.register_blueprint(system_bp, url_prefix='/system')
 
+_INVALID_PAYLOAD_BODY = dumps({'success': False, 'error': 'Invalid JSON payload'})
+_STARTED_BODY = dumps({'success': True, 'message': 'System started', 'status': 'running'})
+_STOPPED_BODY = dumps({'success': True, 'message': 'System stopped', 'status': 'stopped'})
+
 # Global system state (will be initialized in app.py)
 system_state = {
     'is_running': False,
     'controllers': None
 }
+# Serializes start/stop so concurrent POSTs don't race through the controllers
+_state_lock = threading.Lock()
+
+# Config-derived GET responses only change when the config is updated through
+# this blueprint, which clears the cache; the TTL is just a safety net
+_config_cache = ResponseCache(maxsize=16, ttl=300.0)
 
 
 @system_bp.route('/start', methods=['POST'])
 def start_system():
     """Start the irrigation system."""
     try:
-        system_state['is_running'] = True
-        return jsonify({
-            'success': True,
-            'message': 'System started',
-            'status': 'running'
-        }), 200
+        with _state_lock:
+            system_state['is_running'] = True
+        return json_response(_STARTED_BODY, 200)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -47,24 +56,23 @@ def start_system():
 def stop_system():
     """Stop the irrigation system."""
     try:
-        system_state['is_running'] = False
-        
-        # Stop any running operations
-        if system_state['controllers']:
-            irrigation_ctrl = system_state['controllers'].get('irrigation')
-            fertigation_ctrl = system_state['controllers'].get('fertigation')
-            
-            if irrigation_ctrl and irrigation_ctrl.is_running:
-                irrigation_ctrl.stop_irrigation()
+        with _state_lock:
+            system_state['is_running'] = False
             
-            if fertigation_ctrl and fertigation_ctrl.is_running:
-                fertigation_ctrl.stop_fertigation()
+            # Stop any running operations. Checked even when the system flag
+            # was already off: scheduled runs start controllers directly.
+            # Holding the lock means a concurrent stop sees them stopped.
+            if system_state['controllers']:
+                irrigation_ctrl = system_state['controllers'].get('irrigation')
+                fertigation_ctrl = system_state['controllers'].get('fertigation')
+                
+                if irrigation_ctrl and irrigation_ctrl.is_running:
+                    irrigation_ctrl.stop_irrigation()
+                
+                if fertigation_ctrl and fertigation_ctrl.is_running:
+                    fertigation_ctrl.stop_fertigation()
         
-        return jsonify({
-            'success': True,
-            'message': 'System stopped',
-            'status': 'stopped'
-        }), 200
+        return json_response(_STOPPED_BODY, 200)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -111,11 +119,13 @@ def get_calculated_pressure():
     Returns the same calculation that would be used when starting irrigation.
     """
     try:
-        db = next(get_db())
-        try:
+        cache_key = _config_cache.request_key()
+        cached = _config_cache.get(cache_key)
+        if cached is not None:
+            return conditional_response(*cached)
+
+        with session_scope() as db:
             cfg = load_system_config(db)
-        finally:
-            db.close()
 
         pipe_length_m = cfg.get('pipe_length_m', PIPE_LENGTH_M)
         pipe_diameter_m = cfg.get('pipe_diameter_m', PIPE_DIAMETER_M)
@@ -137,7 +147,7 @@ def get_calculated_pressure():
         )
         result = calculator.calculate_required_pressure(zone_slope_degrees, zone_base_pressure_kpa)
 
-        return jsonify({
+        body = dumps({
             'success': True,
             'setup': {
                 'pipe_length_m': pipe_length_m,
@@ -148,7 +158,9 @@ def get_calculated_pressure():
             },
             'calculated_pressure': result,
             'total_required_pressure_kpa': result['total_required_pressure_kpa'],
-        }), 200
+        })
+        etag = _config_cache.set(cache_key, body)
+        return conditional_response(body, etag)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -160,11 +172,13 @@ def get_calculated_pressure():
 def get_zone_info():
     """Get zone configuration information (read-only)."""
     try:
-        db = next(get_db())
-        try:
+        cache_key = _config_cache.request_key()
+        cached = _config_cache.get(cache_key)
+        if cached is not None:
+            return conditional_response(*cached)
+
+        with session_scope() as db:
             cfg = load_system_config(db)
-        finally:
-            db.close()
 
         zone_info = {
             'zone_id': ZONE_ID,
@@ -175,10 +189,12 @@ def get_zone_info():
             'base_pressure': cfg.get('zone_base_pressure_kpa'),
         }
         
-        return jsonify({
+        body = dumps({
             'success': True,
             'zone': zone_info
-        }), 200
+        })
+        etag = _config_cache.set(cache_key, body)
+        return conditional_response(body, etag)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -190,16 +206,20 @@ def get_zone_info():
 def get_system_config():
     """Get system-wide hydraulic and zone configuration (single-zone system)."""
     try:
-        db = next(get_db())
-        try:
+        cache_key = _config_cache.request_key()
+        cached = _config_cache.get(cache_key)
+        if cached is not None:
+            return conditional_response(*cached)
+
+        with session_scope() as db:
             cfg = load_system_config(db)
-        finally:
-            db.close()
 
-        return jsonify({
+        body = dumps({
             'success': True,
             'config': cfg
-        }), 200
+        })
+        etag = _config_cache.set(cache_key, body)
+        return conditional_response(body, etag)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -223,16 +243,13 @@ def update_system_config_route():
     try:
         data = request.get_json() or {}
         if not isinstance(data, dict):
-            return jsonify({
-                'success': False,
-                'error': 'Invalid JSON payload'
-            }), 400
+            return json_response(_INVALID_PAYLOAD_BODY, 400)
 
-        db = next(get_db())
         try:
-            update_result = update_system_config(db, data)
+            with session_scope() as db:
+                update_result = update_system_config(db, data)
         finally:
-            db.close()
+            _config_cache.invalidate()
 
         cfg = update_result.get('config', {})
         applied_keys = update_result.get('applied_keys', [])
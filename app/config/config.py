@@ -45,6 +45,10 @@ DEFAULT_TANK_LEVEL_TRIGGER_PIN = int(os.getenv('DEFAULT_TANK_LEVEL_TRIGGER_PIN',
 DEFAULT_TANK_LEVEL_ECHO_PIN = int(os.getenv('DEFAULT_TANK_LEVEL_ECHO_PIN', '27'))  # Tank level sensor echo (ECHO)
 TANK_EMPTY_DISTANCE_CM = float(os.getenv('TANK_EMPTY_DISTANCE_CM', '100.0'))  # Sensor reading when tank is empty (cm)
 TANK_FULL_DISTANCE_CM = float(os.getenv('TANK_FULL_DISTANCE_CM', '10.0'))  # Sensor reading when tank is full (cm)
+# Fertigation treats the tank as full/empty within this many cm of the readings above
+TANK_LEVEL_TOLERANCE_CM = float(os.getenv('TANK_LEVEL_TOLERANCE_CM', '2.0'))
+TANK_FULL_THRESHOLD_CM = TANK_FULL_DISTANCE_CM + TANK_LEVEL_TOLERANCE_CM  # Full when reading <= this
+TANK_EMPTY_THRESHOLD_CM = TANK_EMPTY_DISTANCE_CM - TANK_LEVEL_TOLERANCE_CM  # Empty when reading >= this
 
 # Zone Configuration (hardcoded - single zone system)
 ZONE_VALVE_GPIO_PIN = int(os.getenv('ZONE_VALVE_GPIO_PIN', '17'))  # GPIO pin for zone valve control
@@ -105,6 +109,10 @@ PRESSURE_OVERPRESSURE_STOP_PERCENT = float(os.getenv('PRESSURE_OVERPRESSURE_STOP
 # Sensor reading intervals
 SENSOR_READ_INTERVAL_SEC = float(os.getenv('SENSOR_READ_INTERVAL_SEC', '5.0'))
 MOISTURE_CHECK_INTERVAL_SEC = float(os.getenv('MOISTURE_CHECK_INTERVAL_SEC', '10.0'))
+# How long /api/sensors/current* reuse a reading before touching the bus again
+SENSOR_CACHE_TTL_SEC = float(os.getenv('SENSOR_CACHE_TTL_SEC', '0.25'))
+# How long controllers reuse the latest weather reading before reading it again
+WEATHER_CACHE_TTL_SEC = float(os.getenv('WEATHER_CACHE_TTL_SEC', '300.0'))
 
 # Safety settings
 MAX_OPERATION_DURATION_SEC = float(os.getenv('MAX_OPERATION_DURATION_SEC', '3600.0'))  # 1 hour max
@@ -1,7 +1,8 @@
 """Database configuration and initialization."""
 import os
 import logging
-from sqlalchemy import create_engine, inspect, text
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -14,17 +15,57 @@ os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
 
 # Create database engine
 DATABASE_URL = f'sqlite:///{DATABASE_PATH}'
-engine = create_engine(DATABASE_URL, connect_args={'check_same_thread': False}, echo=False)
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={'check_same_thread': False},
+    pool_size=10,
+    max_overflow=5,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+    # Compiled-statement cache shared by all sessions (SQLAlchemy default is 500)
+    query_cache_size=1200,
+    echo=False
+)
 
-# Create session factory
-SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
+
+@event.listens_for(engine, 'connect')
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune each new SQLite connection for concurrent API reads and log writes.
+    
+    WAL lets readers proceed while the log writer commits; synchronous=NORMAL
+    is durable across application crashes in WAL mode and avoids an fsync per
+    commit. busy_timeout makes a blocked writer wait instead of failing.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    # Per connection; the pool can hold up to 15, so keep it modest on the Pi
+    cursor.execute('PRAGMA cache_size=-8192')  # 8 MiB page cache
+    cursor.execute('PRAGMA mmap_size=268435456')  # 256 MiB
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA busy_timeout=5000')
+    cursor.close()
+
+
+# Create session factory (thread-local; request handlers release theirs on teardown)
+SessionLocal = scoped_session(
+    sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+)
 
 # Base class for models
 Base = declarative_base()
 
 
+# Set once the schema checks below have run in this process
+_MIGRATED = False
+
+
 def migrate_db():
-    """Run database migrations to add missing columns."""
+    """Run database migrations to add missing columns (once per process)."""
+    global _MIGRATED
+    if _MIGRATED:
+        return
     inspector = inspect(engine)
     
     # Check if zone_configs table exists
@@ -39,6 +80,21 @@ def migrate_db():
                 conn.execute(text('ALTER TABLE zone_configs ADD COLUMN soil_moisture_sensor_channel INTEGER'))
                 conn.commit()
             logging.info("✓ Migration completed: soil_moisture_sensor_channel column added")
+    _MIGRATED = True
+
+
+def create_missing_indexes():
+    """Create indexes declared on models that are missing from existing tables."""
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_indexes = {ix['name'] for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                logging.info(f"Creating missing index: {index.name} on {table.name}")
+                index.create(bind=engine)
 
 
 def init_db():
@@ -49,8 +105,12 @@ def init_db():
         ZoneConfig, SystemConfig, SolenoidStatus
     )
     Base.metadata.create_all(bind=engine)
+    if _MIGRATED:
+        # Schema already checked in this process; skip the PRAGMA round trips
+        return
     # Run migrations after creating tables
     migrate_db()
+    create_missing_indexes()
 
 
 def get_db():
@@ -61,3 +121,12 @@ def get_db():
     finally:
         db.close()
 
+
+@contextmanager
+def session_scope():
+    """Provide a database session that is closed when the block exits."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -1,6 +1,8 @@
 """Fertigation cycle controller."""
 import time
+import queue
 import threading
+import logging
 from typing import Dict, Optional, Callable
 from datetime import datetime
 from app.hydraulics.valve_controller import HydraulicValveController
@@ -14,11 +16,38 @@ from app.sensors.tank_level import TankLevelSensor
 from app.sensors.pressure import PressureSensor
 from app.sensors.weather import WeatherReader
 from app.config.config import (
-    TANK_EMPTY_DISTANCE_CM, TANK_FULL_DISTANCE_CM, MAX_OPERATION_DURATION_SEC,
-    PUMP_PRESSURE_TOLERANCE_KPA, PRESSURE_OVERPRESSURE_STOP_PERCENT,
+    TANK_EMPTY_DISTANCE_CM, TANK_FULL_THRESHOLD_CM, TANK_EMPTY_THRESHOLD_CM,
+    MAX_OPERATION_DURATION_SEC, PUMP_PRESSURE_TOLERANCE_KPA, PRESSURE_OVERPRESSURE_STOP_PERCENT,
 )
 from app.models.operational_log import OperationalLog, OperationType, OperationStatus
 from app.models.system_log import SystemLog, LogLevel
+from app.services.log_writer import LogWriter
+from app.services.weather_cache import WeatherCache
+
+logger = logging.getLogger(__name__)
+
+# How often the flush loop reads the fertilizer pump pressure; status polls
+# reuse a reading up to this old instead of touching the ADC themselves
+_PRESSURE_CHECK_INTERVAL_SEC = 2.0
+# A failing sensor would otherwise log the same warning row every loop tick
+_REPEATED_WARNING_INTERVAL_SEC = 30.0
+# Bounds of the adaptive tank level poll interval during the flush
+_LEVEL_POLL_MIN_SEC = 1.0
+_LEVEL_POLL_MAX_SEC = 10.0
+
+
+def _level_poll_interval(distance_cm: float, drain_rate_cm_per_s: Optional[float]) -> float:
+    """
+    Return how long to wait before the next tank level read during the flush.
+
+    Polls at a quarter of the projected time to empty at the average drain
+    rate so far, within [_LEVEL_POLL_MIN_SEC, _LEVEL_POLL_MAX_SEC]. Without a
+    positive drain rate yet, polls at the minimum interval.
+    """
+    if not drain_rate_cm_per_s or drain_rate_cm_per_s <= 0:
+        return _LEVEL_POLL_MIN_SEC
+    time_to_empty = (TANK_EMPTY_THRESHOLD_CM - distance_cm) / drain_rate_cm_per_s
+    return max(_LEVEL_POLL_MIN_SEC, min(_LEVEL_POLL_MAX_SEC, time_to_empty / 4.0))
 
 
 class FertigationController:
@@ -57,7 +86,9 @@ class FertigationController:
         self.tank_valve_controller = tank_valve_controller
         self.tank_level_sensor = tank_level_sensor
         self.db_session_factory = db_session_factory
+        self.log_writer = LogWriter(db_session_factory)
         self.weather_reader = weather_reader
+        self.weather_cache = WeatherCache(weather_reader) if weather_reader else None
         self.check_weather = check_weather
         self.pressure_sensor = pressure_sensor
         self.fertilizer_pump_controller = fertilizer_pump_controller
@@ -70,6 +101,18 @@ class FertigationController:
         self.current_zone: Optional[int] = None
         self.operation_thread: Optional[threading.Thread] = None
         self.start_time: Optional[datetime] = None
+        # Monotonic counterpart of start_time, used for the logged duration
+        self._start_monotonic: Optional[float] = None
+        # Stop event of the current run, also used to tell whether run state
+        # still belongs to a finishing cycle; set by stop_fertigation() so the
+        # cycle's polling waits return immediately
+        self._cycle_stop: Optional[threading.Event] = None
+        # When each warning was last written by _warn_deduped(), reset per cycle
+        self._warning_times: Dict[str, float] = {}
+        # Cycles run one at a time on a single long-lived worker thread;
+        # the queue holds at most one pending (zone_id, stop_event)
+        self._cycle_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._start_lock = threading.Lock()
 
     def start_fertigation(self, zone_id: int) -> Dict[str, any]:
         """
@@ -81,39 +124,37 @@ class FertigationController:
         Returns:
             Dictionary with operation status
         """
-        if self.is_running:
-            return {
-                'success': False,
-                'message': 'Fertigation already in progress',
-                'current_zone': self.current_zone
-            }
-        
-        # Check weather if enabled
-        if self.check_weather and self.weather_reader:
-            try:
-                weather_data = self.weather_reader.read_standardized()
-                # Allow fertigation in clear or cloudy conditions, but warn about rainy conditions
-                if weather_data['condition'] == 'rainy':
-                    return {
-                        'success': False,
-                        'message': f'Weather condition is {weather_data["condition"]}, not suitable for fertigation',
-                        'weather_condition': weather_data['condition']
-                    }
-            except Exception as e:
-                self._log_system(LogLevel.WARNING, 'fertigation_controller',
-                               f'Failed to check weather: {str(e)}, proceeding with fertigation')
-        
-        # Start fertigation in background thread
-        self.is_running = True
-        self.current_zone = zone_id
-        self.start_time = datetime.now()
-        
-        self.operation_thread = threading.Thread(
-            target=self._fertigation_cycle,
-            args=(zone_id,),
-            daemon=True
-        )
-        self.operation_thread.start()
+        with self._start_lock:
+            if self.is_running:
+                return self._already_running()
+            
+            # Check weather if enabled
+            if self.check_weather and self.weather_cache:
+                try:
+                    weather_data = self.weather_cache.read()
+                    # Allow fertigation in clear or cloudy conditions, but warn about rainy conditions
+                    if weather_data['condition'] == 'rainy':
+                        return {
+                            'success': False,
+                            'message': f'Weather condition is {weather_data["condition"]}, not suitable for fertigation',
+                            'weather_condition': weather_data['condition']
+                        }
+                except Exception as e:
+                    self._log_system(LogLevel.WARNING, 'fertigation_controller',
+                                   f'Failed to check weather: {str(e)}, proceeding with fertigation')
+            
+            # Hand the cycle to the background worker; run state is set first
+            # because the worker may pick the zone up immediately
+            # Each run gets its own stop event so a restart can't clear the
+            # stop meant for a cycle still unwinding
+            stop_event = threading.Event()
+            self._cycle_stop = stop_event
+            self.is_running = True
+            self.current_zone = zone_id
+            self.start_time = datetime.now()
+            self._start_monotonic = time.monotonic()
+            self._ensure_worker()
+            self._cycle_queue.put_nowait((zone_id, stop_event))
         
         return {
             'success': True,
@@ -121,9 +162,46 @@ class FertigationController:
             'zone_id': zone_id
         }
 
-    def _fertigation_cycle(self, zone_id: int):
+    def _already_running(self) -> Dict[str, any]:
+        return {
+            'success': False,
+            'message': 'Fertigation already in progress',
+            'current_zone': self.current_zone
+        }
+
+    def _ensure_worker(self):
+        """Start the cycle worker thread on first use, or again if it died."""
+        if self.operation_thread is None or not self.operation_thread.is_alive():
+            self.operation_thread = threading.Thread(target=self._run_worker, daemon=True)
+            self.operation_thread.start()
+
+    def _run_worker(self):
+        """Run queued fertigation cycles one after another."""
+        while True:
+            zone_id, stop_event = self._cycle_queue.get()
+            if stop_event.is_set():
+                # Stopped before the worker picked it up
+                continue
+            # A failing cleanup must not kill the worker, or every later
+            # cycle would sit in the queue and never run
+            try:
+                self._fertigation_cycle(zone_id, stop_event)
+            except Exception:
+                logger.exception("Fertigation cycle for zone %s failed", zone_id)
+                self._end_run(stop_event)
+
+    def _end_run(self, stop_event: threading.Event):
+        """Clear run state if it still belongs to the cycle owning stop_event."""
+        with self._start_lock:
+            if self._cycle_stop is stop_event:
+                self.is_running = False
+                self.current_zone = None
+                self._cycle_stop = None
+
+    def _fertigation_cycle(self, zone_id: int, stop_event: threading.Event):
         """Execute fertigation cycle with new flow."""
         self._over_pressure_notes = None
+        self._warning_times.clear()
         try:
             # Log operation start
             self._log_operation(zone_id, OperationStatus.STARTED)
@@ -149,15 +227,14 @@ class FertigationController:
             # Wait for tank to fill: sensor reads distance; full when distance <= 10 cm
             tank_filled = False
             initial_tank_level = None
-            fill_start_time = time.time()
             fill_timeout = 300  # 5 minutes max for filling
-            tolerance_cm = 2.0
+            fill_deadline = time.monotonic() + fill_timeout
 
-            while time.time() - fill_start_time < fill_timeout:
+            while time.monotonic() < fill_deadline:
                 try:
                     level_data = self.tank_level_sensor.read_standardized()
                     distance_cm = level_data['value']  # 10 cm = full, 100 cm = empty
-                    if distance_cm <= TANK_FULL_DISTANCE_CM + tolerance_cm:
+                    if distance_cm <= TANK_FULL_THRESHOLD_CM:
                         tank_filled = True
                         # Fill depth for volume calc: empty - distance
                         initial_tank_level = TANK_EMPTY_DISTANCE_CM - distance_cm
@@ -165,10 +242,11 @@ class FertigationController:
                                        f'Tank full (sensor {distance_cm:.1f} cm)')
                         break
                 except Exception as e:
-                    self._log_system(LogLevel.WARNING, 'fertigation_controller',
-                                   f'Error reading tank level during fill: {str(e)}')
+                    self._warn_deduped('fertigation_controller',
+                                       f'Error reading tank level during fill: {str(e)}')
                 
-                time.sleep(2)  # Check every 2 seconds
+                if stop_event.wait(2):  # Check every 2 seconds until stopped
+                    break
             
             # Stop irrigation pump and close inlet valve
             if self.irrigation_pump_controller:
@@ -178,6 +256,10 @@ class FertigationController:
             
             self.tank_valve_controller.close_inlet()
             
+            if stop_event.is_set():
+                # stop_fertigation() already shut everything down and logged the stop
+                return
+            
             if not tank_filled:
                 raise Exception('Tank filling timeout or failed')
             
@@ -239,63 +321,90 @@ class FertigationController:
             self._log_operation(zone_id, OperationStatus.IN_PROGRESS)
 
             # Monitor tank level until empty (sensor reads distance; empty when distance >= 100 cm)
-            operation_start_time = time.time()
-            last_pressure_check = time.time()
-            tolerance_cm = 2.0
+            # Loop invariants are bound to locals once; the loop runs at 1 Hz
+            # for up to MAX_OPERATION_DURATION_SEC
+            monotonic = time.monotonic
+            pump = self.fertilizer_pump_controller
+            pressure_sensor = self.pressure_sensor if pump else None
+            level_sensor = self.tank_level_sensor
+            overpressure_factor = 1.0 + PRESSURE_OVERPRESSURE_STOP_PERCENT / 100.0
+            operation_deadline = monotonic() + MAX_OPERATION_DURATION_SEC
+            next_pressure_check = monotonic() + _PRESSURE_CHECK_INTERVAL_SEC
+            # The level changes slowly while draining, so reads back off as
+            # the average drain rate shows the tank is far from empty
+            next_level_check = monotonic()
+            first_level = None  # (time, distance) of the first good flush reading
+            last_distance_cm = None  # Latest good reading, reused for the final volume
 
-            while self.is_running:
+            # is_running stays in the condition as a fail-safe: the cycle also
+            # ends once its run state has been cleared
+            while self.is_running and not stop_event.is_set():
+                now = monotonic()
                 # Check for timeout
-                if time.time() - operation_start_time > MAX_OPERATION_DURATION_SEC:
+                if now > operation_deadline:
                     self._log_system(LogLevel.WARNING, 'fertigation_controller',
                                    f'Fertigation timeout reached for zone {zone_id}')
                     break
                 
                 # Monitor fertilizer pump pressure if sensor is available
-                if self.pressure_sensor and self.fertilizer_pump_controller:
-                    if time.time() - last_pressure_check >= 2.0:  # Check every 2 seconds
-                        try:
-                            pressure_data = self.pressure_sensor.read_standardized()
-                            current_pressure = pressure_data['value']
-                            target_pressure = self.fertilizer_pump_controller.target_pressure_kpa
-                            
-                            # Stop fertigation if pressure exceeds target by configured percent
-                            if target_pressure > 0:
-                                overpressure_limit = target_pressure * (1.0 + PRESSURE_OVERPRESSURE_STOP_PERCENT / 100.0)
-                                if current_pressure > overpressure_limit:
-                                    over_pressure_msg = (
-                                        f'Over-pressure stop: {current_pressure:.1f} kPa exceeds required pressure limit '
-                                        f'({overpressure_limit:.1f} kPa, target + {PRESSURE_OVERPRESSURE_STOP_PERCENT}%)'
-                                    )
-                                    self._log_system(LogLevel.ERROR, 'fertigation_controller', over_pressure_msg)
-                                    self._over_pressure_notes = over_pressure_msg
-                                    break
-                            
-                            # Maintain pump pressure
-                            self.fertilizer_pump_controller.maintain_pressure(current_pressure)
-                            
-                            # Log pressure if outside tolerance
-                            if self.fertilizer_pump_controller.is_controlling:
-                                if abs(current_pressure - target_pressure) > PUMP_PRESSURE_TOLERANCE_KPA:
-                                    self._log_system(LogLevel.WARNING, 'fertigation_controller',
-                                                   f'Fertilizer pump pressure deviation: {current_pressure:.1f} kPa (target: {target_pressure:.1f} kPa)')
-                        except Exception as e:
-                            self._log_system(LogLevel.WARNING, 'fertigation_controller',
-                                           f'Error reading fertilizer pump pressure: {str(e)}')
+                if pressure_sensor and now >= next_pressure_check:
+                    try:
+                        pressure_data = pressure_sensor.read_standardized()
+                        current_pressure = pressure_data['value']
+                        target_pressure = pump.target_pressure_kpa
+                        
+                        # Stop fertigation if pressure exceeds target by configured percent
+                        if target_pressure > 0:
+                            overpressure_limit = target_pressure * overpressure_factor
+                            if current_pressure > overpressure_limit:
+                                over_pressure_msg = (
+                                    f'Over-pressure stop: {current_pressure:.1f} kPa exceeds required pressure limit '
+                                    f'({overpressure_limit:.1f} kPa, target + {PRESSURE_OVERPRESSURE_STOP_PERCENT}%)'
+                                )
+                                self._log_system(LogLevel.ERROR, 'fertigation_controller', over_pressure_msg)
+                                self._over_pressure_notes = over_pressure_msg
+                                break
                         
-                        last_pressure_check = time.time()
+                        # Maintain pump pressure
+                        pump.maintain_pressure(current_pressure)
+                        
+                        # Log pressure if outside tolerance
+                        if pump.is_controlling:
+                            if abs(current_pressure - target_pressure) > PUMP_PRESSURE_TOLERANCE_KPA:
+                                self._log_system(LogLevel.WARNING, 'fertigation_controller',
+                                               f'Fertilizer pump pressure deviation: {current_pressure:.1f} kPa (target: {target_pressure:.1f} kPa)')
+                    except Exception as e:
+                        self._warn_deduped('fertigation_controller',
+                                           f'Error reading fertilizer pump pressure: {str(e)}')
+                    
+                    next_pressure_check = monotonic() + _PRESSURE_CHECK_INTERVAL_SEC
                 
-                try:
-                    level_data = self.tank_level_sensor.read_standardized()
-                    distance_cm = level_data['value']  # 10 cm = full, 100 cm = empty
-                    if distance_cm >= TANK_EMPTY_DISTANCE_CM - tolerance_cm:
-                        self._log_system(LogLevel.INFO, 'fertigation_controller',
-                                       f'Tank empty (sensor {distance_cm:.1f} cm)')
-                        break
-                except Exception as e:
-                    self._log_system(LogLevel.WARNING, 'fertigation_controller',
-                                   f'Error reading tank level during flush: {str(e)}')
+                if now >= next_level_check:
+                    try:
+                        level_data = level_sensor.read_standardized()
+                        distance_cm = level_data['value']  # 10 cm = full, 100 cm = empty
+                        last_distance_cm = distance_cm
+                        if distance_cm >= TANK_EMPTY_THRESHOLD_CM:
+                            self._log_system(LogLevel.INFO, 'fertigation_controller',
+                                           f'Tank empty (sensor {distance_cm:.1f} cm)')
+                            break
+                        drain_rate = None
+                        if first_level is None:
+                            first_level = (now, distance_cm)
+                        elif now > first_level[0]:
+                            drain_rate = (distance_cm - first_level[1]) / (now - first_level[0])
+                        next_level_check = now + _level_poll_interval(distance_cm, drain_rate)
+                    except Exception as e:
+                        self._warn_deduped('fertigation_controller',
+                                           f'Error reading tank level during flush: {str(e)}')
+                        next_level_check = now + _LEVEL_POLL_MIN_SEC
                 
-                time.sleep(1)  # Small delay to prevent CPU spinning
+                # Sleep until the next pressure or level read is due
+                next_check = next_level_check
+                if pressure_sensor:
+                    next_check = min(next_check, next_pressure_check)
+                if stop_event.wait(max(next_check - monotonic(), 0.0)):
+                    break
             
             # Stop fertilizer pump if controller is available
             if self.fertilizer_pump_controller:
@@ -310,8 +419,16 @@ class FertigationController:
                 self._log_system(LogLevel.INFO, 'fertigation_controller',
                                'Fertilizer pump solenoid closed')
             
+            if stop_event.is_set() or not self.is_running:
+                # stop_fertigation() already logged the final state for this cycle,
+                # but its shutdown may have run before setup reopened the zone valve
+                self.valve_controller.close_zone(zone_id)
+                return
+            
             # Stop fertigation (pass over-pressure reason for activity log if we stopped due to over-pressure)
-            self._stop_fertigation(zone_id, initial_tank_level, failure_notes=self._over_pressure_notes)
+            self._stop_fertigation(zone_id, initial_tank_level, stop_event,
+                                   failure_notes=self._over_pressure_notes,
+                                   final_distance_cm=last_distance_cm)
             
         except Exception as e:
             self._log_system(LogLevel.ERROR, 'fertigation_controller',
@@ -322,13 +439,13 @@ class FertigationController:
             if self.fertilizer_pump_controller:
                 try:
                     self.fertilizer_pump_controller.stop_pressure_control()
-                except:
+                except Exception:
                     pass
             
             if self.irrigation_pump_controller:
                 try:
                     self.irrigation_pump_controller.stop_pressure_control()
-                except:
+                except Exception:
                     pass
             
             # Ensure valves are closed (outlet and fertilizer pump solenoid)
@@ -340,34 +457,41 @@ class FertigationController:
                     pass
             self.valve_controller.close_zone(zone_id)
 
-            self.is_running = False
-            self.current_zone = None
+            self._end_run(stop_event)
 
-    def _stop_fertigation(self, zone_id: int, initial_tank_level: float, failure_notes: Optional[str] = None):
-        """Stop fertigation and clean up. If failure_notes is set (e.g. over-pressure), log as FAILED in activity log."""
+    def _stop_fertigation(self, zone_id: int, initial_tank_level: float, stop_event: threading.Event,
+                          failure_notes: Optional[str] = None, final_distance_cm: Optional[float] = None):
+        """
+        Stop fertigation and clean up. If failure_notes is set (e.g. over-pressure), log as FAILED in activity log.
+
+        final_distance_cm is the flush loop's last tank reading; the sensor is
+        only read again when it is not given.
+        """
         try:
             # Stop all pumps and valves first so the physical stop always happens
             if self.fertilizer_pump_controller:
                 try:
                     self.fertilizer_pump_controller.stop_pressure_control()
-                except:
+                except Exception:
                     pass
             if self.irrigation_pump_controller:
                 try:
                     self.irrigation_pump_controller.stop_pressure_control()
-                except:
+                except Exception:
                     pass
             self.tank_valve_controller.close_all()
             self.valve_controller.close_zone(zone_id)
             
             final_tank_level = 0.0
-            try:
-                level_data = self.tank_level_sensor.read_standardized()
-                final_tank_level = TANK_EMPTY_DISTANCE_CM - level_data['value']
-            except:
-                pass
+            if final_distance_cm is None:
+                try:
+                    final_distance_cm = self.tank_level_sensor.read_cached()['value']
+                except Exception:
+                    pass
+            if final_distance_cm is not None:
+                final_tank_level = TANK_EMPTY_DISTANCE_CM - final_distance_cm
             
-            duration = (datetime.now() - self.start_time).total_seconds() if self.start_time else 0.0
+            duration = time.monotonic() - self._start_monotonic if self._start_monotonic is not None else 0.0
             fertilizer_volume = max(0.0, initial_tank_level - final_tank_level)
             
             if failure_notes:
@@ -381,30 +505,45 @@ class FertigationController:
                                    fertilizer_volume=fertilizer_volume)
         finally:
             # Always clear run state so over-pressure stop is effective even if logging fails
-            self.is_running = False
-            self.current_zone = None
+            self._end_run(stop_event)
 
     def stop_fertigation(self) -> Dict[str, any]:
         """Stop current fertigation cycle."""
-        if not self.is_running:
-            return {
-                'success': False,
-                'message': 'No fertigation in progress'
-            }
-        
-        self.is_running = False
+        # Same lock as start_fertigation so a start and a stop can't interleave
+        # their flag updates
+        with self._start_lock:
+            if not self.is_running:
+                return {
+                    'success': False,
+                    'message': 'No fertigation in progress'
+                }
+            
+            stop_event = self._cycle_stop
+            stop_event.set()
+            # Drop a cycle the worker has not picked up yet
+            try:
+                self._cycle_queue.get_nowait()
+            except queue.Empty:
+                pass
+            zone_id = self.current_zone
+            # Reset run state before releasing the lock so a start that follows
+            # can't have it cleared by the slow shutdown below
+            self.is_running = False
+            self.current_zone = None
+            self._cycle_stop = None
         
-        if self.current_zone:
+        # Hardware shutdown and logging run outside the lock
+        if zone_id:
             # Fill depth for logging (value = distance; fill = empty - distance)
             initial_level = 0.0
             try:
-                level_data = self.tank_level_sensor.read_standardized()
+                level_data = self.tank_level_sensor.read_cached()
                 initial_level = TANK_EMPTY_DISTANCE_CM - level_data['value']
-            except:
+            except Exception:
                 pass
             
-            self._stop_fertigation(self.current_zone, initial_level)
-            self._log_operation(self.current_zone, OperationStatus.STOPPED)
+            self._stop_fertigation(zone_id, initial_level, stop_event)
+            self._log_operation(zone_id, OperationStatus.STOPPED)
         
         return {
             'success': True,
@@ -415,17 +554,17 @@ class FertigationController:
         """Get fertigation controller status."""
         tank_level = None
         try:
-            level_data = self.tank_level_sensor.read_standardized()
+            level_data = self.tank_level_sensor.read_cached()
             tank_level = level_data['value']
-        except:
+        except Exception:
             pass
         
         fertilizer_pressure = None
         if self.pressure_sensor:
             try:
-                pressure_data = self.pressure_sensor.read_standardized()
+                pressure_data = self.pressure_sensor.read_cached(_PRESSURE_CHECK_INTERVAL_SEC)
                 fertilizer_pressure = pressure_data['value']
-            except:
+            except Exception:
                 pass
         
         fertilizer_pump_status = None
@@ -451,7 +590,6 @@ class FertigationController:
     def _log_operation(self, zone_id: int, status: OperationStatus, **kwargs):
         """Log operation to database."""
         try:
-            db = next(self.db_session_factory())
             log = OperationalLog(
                 operation_type=OperationType.FERTIGATION,
                 zone_id=zone_id,
@@ -460,25 +598,28 @@ class FertigationController:
                 fertilizer_volume=kwargs.get('fertilizer_volume'),
                 notes=kwargs.get('notes')
             )
-            db.add(log)
-            db.commit()
-            db.close()
+            self.log_writer.submit(log)
         except Exception as e:
-            print(f"Error logging operation: {str(e)}")
+            logger.error("Error logging operation: %s", e)
 
     def _log_system(self, level: LogLevel, component: str, message: str):
         """Log system event."""
         try:
-            db = next(self.db_session_factory())
             log = SystemLog(
                 log_level=level,
                 component=component,
                 message=message,
                 zone_id=self.current_zone
             )
-            db.add(log)
-            db.commit()
-            db.close()
+            self.log_writer.submit(log)
         except Exception as e:
-            print(f"Error logging system event: {str(e)}")
+            logger.error("Error logging system event: %s", e)
 
+    def _warn_deduped(self, component: str, message: str):
+        """Log a warning unless the same message was logged within the repeat interval."""
+        now = time.monotonic()
+        last = self._warning_times.get(message)
+        if last is not None and now - last < _REPEATED_WARNING_INTERVAL_SEC:
+            return
+        self._warning_times[message] = now
+        self._log_system(LogLevel.WARNING, component, message)
@@ -1,6 +1,7 @@
 """Irrigation cycle controller."""
 import time
 import threading
+import logging
 from typing import Dict, Optional, Callable
 from datetime import datetime
 from app.hydraulics.pressure_calculator import PressureCalculator
@@ -17,6 +18,10 @@ from app.config.config import (
 from app.utils.system_config_helper import load_system_config
 from app.models.operational_log import OperationalLog, OperationType, OperationStatus
 from app.models.system_log import SystemLog, LogLevel
+from app.services.log_writer import LogWriter
+from app.services.weather_cache import WeatherCache
+
+logger = logging.getLogger(__name__)
 
 
 class IrrigationController:
@@ -51,14 +56,19 @@ class IrrigationController:
         self.decision_engine = decision_engine
         self.soil_moisture_sensors = soil_moisture_sensors
         self.weather_reader = weather_reader
+        self.weather_cache = WeatherCache(weather_reader)
         self.pressure_sensor = pressure_sensor
         self.db_session_factory = db_session_factory
+        self.log_writer = LogWriter(db_session_factory)
         self.irrigation_pump_solenoid = irrigation_pump_solenoid
         
         self.is_running = False
         self.current_zone: Optional[int] = None
         self.operation_thread: Optional[threading.Thread] = None
         self.start_time: Optional[datetime] = None
+        # Stop event of the current run; set by stop_irrigation() so the
+        # cycle's polling wait returns immediately
+        self._stop_event = threading.Event()
 
     def start_irrigation(self, zone_id: int, zone_config: Dict, skip_weather_check: bool = False) -> Dict[str, any]:
         """
@@ -94,7 +104,7 @@ class IrrigationController:
         else:
             # Check weather (skip if not clear)
             try:
-                weather_data = self.weather_reader.read_standardized()
+                weather_data = self.weather_cache.read()
             except Exception as e:
                 self._log_system(LogLevel.ERROR, 'irrigation_controller',
                                f'Failed to read weather data: {str(e)}')
@@ -176,14 +186,16 @@ class IrrigationController:
                 'weather_humidity': weather_data.get('humidity')
             }
         
-        # Start irrigation in background thread
+        # Start irrigation in background thread. Each run gets its own stop
+        # event so a restart can't clear the stop meant for a cycle still unwinding
+        self._stop_event = threading.Event()
         self.is_running = True
         self.current_zone = zone_id
         self.start_time = datetime.now()
         
         self.operation_thread = threading.Thread(
             target=self._irrigation_cycle,
-            args=(zone_id, zone_config, current_moisture, weather_data),
+            args=(zone_id, zone_config, current_moisture, weather_data, self._stop_event),
             daemon=True
         )
         self.operation_thread.start()
@@ -201,8 +213,10 @@ class IrrigationController:
             'decision': decision
         }
 
-    def _irrigation_cycle(self, zone_id: int, zone_config: Dict, start_moisture: float, weather_data: Dict = None):
+    def _irrigation_cycle(self, zone_id: int, zone_config: Dict, start_moisture: float, weather_data: Dict = None,
+                          stop_event: Optional[threading.Event] = None):
         """Execute irrigation cycle."""
+        stop_event = stop_event or self._stop_event
         self._over_pressure_notes = None
         try:
             # Log operation start with weather info
@@ -241,6 +255,11 @@ class IrrigationController:
             )
             target_pressure = pressure_calc['total_required_pressure_kpa']
             
+            if stop_event.is_set():
+                # Stopped during setup, before anything was opened;
+                # stop_irrigation() already shut down and logged the stop
+                return
+            
             # Open irrigation pump solenoid so water can flow (when present)
             if self.irrigation_pump_solenoid:
                 self.irrigation_pump_solenoid.open()
@@ -262,7 +281,9 @@ class IrrigationController:
             last_moisture_check = time.time()
             operation_start_time = time.time()
             
-            while self.is_running:
+            # is_running stays in the condition as a fail-safe: the cycle also
+            # ends once its run state has been cleared
+            while self.is_running and not stop_event.is_set():
                 # Check for timeout
                 if time.time() - operation_start_time > MAX_OPERATION_DURATION_SEC:
                     self._log_system(LogLevel.WARNING, 'irrigation_controller',
@@ -309,7 +330,17 @@ class IrrigationController:
                     
                     last_moisture_check = time.time()
                 
-                time.sleep(1)  # Small delay to prevent CPU spinning
+                if stop_event.wait(1):  # Small delay to prevent CPU spinning
+                    break
+            
+            if stop_event.is_set() or not self.is_running:
+                # stop_irrigation() already logged the stop, but its shutdown may
+                # have run before setup opened the valve and started the pump
+                self.pump_controller.stop_pressure_control()
+                self.valve_controller.close_zone(zone_id)
+                if self.irrigation_pump_solenoid:
+                    self.irrigation_pump_solenoid.close()
+                return
             
             # Stop irrigation (pass over-pressure reason for activity log if we stopped due to over-pressure)
             self._stop_irrigation(zone_id, start_moisture, failure_notes=self._over_pressure_notes)
@@ -351,7 +382,7 @@ class IrrigationController:
             duration = (datetime.now() - self.start_time).total_seconds() if self.start_time else 0.0
             weather_info = None
             try:
-                weather_info = self.weather_reader.read_standardized()
+                weather_info = self.weather_cache.read()
             except:
                 pass
             
@@ -381,6 +412,7 @@ class IrrigationController:
                 'message': 'No irrigation in progress'
             }
         
+        self._stop_event.set()
         self.is_running = False
         
         if self.current_zone:
@@ -406,7 +438,7 @@ class IrrigationController:
         # Get current weather information
         weather_info = None
         try:
-            weather_data = self.weather_reader.read_standardized()
+            weather_data = self.weather_cache.read()
             weather_info = {
                 'condition': weather_data.get('condition'),
                 'temperature': weather_data.get('temperature'),
@@ -429,8 +461,6 @@ class IrrigationController:
     def _log_operation(self, zone_id: int, status: OperationStatus, **kwargs):
         """Log operation to database."""
         try:
-            db = next(self.db_session_factory())
-            
             # Build notes string with weather info if available
             notes = kwargs.get('notes', '')
             weather_info = kwargs.get('weather_info')
@@ -455,25 +485,20 @@ class IrrigationController:
                 end_moisture=kwargs.get('end_moisture'),
                 notes=notes
             )
-            db.add(log)
-            db.commit()
-            db.close()
+            self.log_writer.submit(log)
         except Exception as e:
-            print(f"Error logging operation: {str(e)}")
+            logger.error("Error logging operation: %s", e)
 
     def _log_system(self, level: LogLevel, component: str, message: str):
         """Log system event."""
         try:
-            db = next(self.db_session_factory())
             log = SystemLog(
                 log_level=level,
                 component=component,
                 message=message,
                 zone_id=self.current_zone
             )
-            db.add(log)
-            db.commit()
-            db.close()
+            self.log_writer.submit(log)
         except Exception as e:
-            print(f"Error logging system event: {str(e)}")
+            logger.error("Error logging system event: %s", e)
 
@@ -12,6 +12,7 @@ except (ImportError, NotImplementedError):
     ADS = None
     AnalogIn = None
 
+import threading
 from typing import Optional
 
 
@@ -37,6 +38,9 @@ class ADS1115ADC:
         self.ads = None
         self.channels = {}  # channel -> AnalogIn object
         self._device_unavailable = False  # Set True if real device fails (e.g. disconnected)
+        # A conversion selects the channel mux then reads the result; serialize
+        # reads so concurrent callers cannot interleave channels on the bus
+        self._bus_lock = threading.Lock()
         
         if not self.use_mock:
             try:
@@ -89,8 +93,9 @@ class ADS1115ADC:
         Returns:
             Voltage in volts
         """
-        analog_in = self.get_channel(channel)
-        return analog_in.voltage
+        with self._bus_lock:
+            analog_in = self.get_channel(channel)
+            return analog_in.voltage
 
     def read_normalized(self, channel: int) -> float:
         """
@@ -111,16 +116,17 @@ class ADS1115ADC:
         if self._device_unavailable:
             raise OSError("ADS1115 device unavailable (disconnected or not responding)")
         
-        analog_in = self.get_channel(channel)
-        try:
-            # ADS1115 has ±4.096V range, normalize to 0-1
-            # Assuming sensor outputs 0-3.3V (typical for Raspberry Pi)
-            voltage = analog_in.voltage
-            normalized = voltage / 3.3  # Normalize to 0-1 range
-            return max(0.0, min(1.0, normalized))
-        except (OSError, RuntimeError) as e:
-            self._device_unavailable = True
-            raise OSError(f"ADS1115 read failed (device may be disconnected): {e}") from e
+        with self._bus_lock:
+            analog_in = self.get_channel(channel)
+            try:
+                # ADS1115 has ±4.096V range, normalize to 0-1
+                # Assuming sensor outputs 0-3.3V (typical for Raspberry Pi)
+                voltage = analog_in.voltage
+                normalized = voltage / 3.3  # Normalize to 0-1 range
+                return max(0.0, min(1.0, normalized))
+            except (OSError, RuntimeError) as e:
+                self._device_unavailable = True
+                raise OSError(f"ADS1115 read failed (device may be disconnected): {e}") from e
 
     def set_mock_value(self, channel: int, value: float):
         """
@@ -173,7 +173,8 @@ class HydraulicPumpController:
         current_pressure = None
         if self.pressure_sensor:
             try:
-                data = self.pressure_sensor.read_standardized()
+                # Shares a recent reading with the control loop and other pollers
+                data = self.pressure_sensor.read_cached()
                 current_pressure = data.get('value')
             except Exception:
                 pass
@@ -1,5 +1,5 @@
 """Operational log model for storing irrigation/fertigation operations."""
-from sqlalchemy import Column, Integer, String, Float, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, Enum, Index
 from sqlalchemy.sql import func
 from app.config.database import Base
 import enum
@@ -39,6 +39,12 @@ class OperationalLog(Base):
     end_moisture = Column(Float, nullable=True)  # Soil moisture at end (%)
     notes = Column(String(500), nullable=True)  # Additional notes
 
+    __table_args__ = (
+        # Log listings filter by operation type and/or zone, newest first
+        Index('ix_operational_logs_type_timestamp', 'operation_type', 'timestamp'),
+        Index('ix_operational_logs_zone_type_timestamp', 'zone_id', 'operation_type', 'timestamp'),
+    )
+
     def __repr__(self):
         return f"<OperationalLog(id={self.id}, type={self.operation_type.value}, zone={self.zone_id}, status={self.status.value})>"
 
@@ -1,5 +1,5 @@
 """Schedule models for irrigation and fertigation schedules."""
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Time
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Time, Index
 from sqlalchemy.sql import func
 from app.config.database import Base
 import enum
@@ -29,6 +29,11 @@ class IrrigationSchedule(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
+    __table_args__ = (
+        # Listing order: zone, then weekday, then time of day
+        Index('ix_irrigation_schedules_zone_day_time', 'zone_id', 'day_of_week', 'time'),
+    )
+
     def __repr__(self):
         return f"<IrrigationSchedule(id={self.id}, zone={self.zone_id}, day={self.day_of_week}, time={self.time}, enabled={self.enabled})>"
 
@@ -46,6 +51,11 @@ class FertigationSchedule(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
+    __table_args__ = (
+        # Listing order: zone, then weekday, then time of day
+        Index('ix_fertigation_schedules_zone_day_time', 'zone_id', 'day_of_week', 'time'),
+    )
+
     def __repr__(self):
         return f"<FertigationSchedule(id={self.id}, zone={self.zone_id}, day={self.day_of_week}, time={self.time}, enabled={self.enabled})>"
 
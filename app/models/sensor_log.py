@@ -1,5 +1,5 @@
 """Sensor log model for storing sensor readings."""
-from sqlalchemy import Column, Integer, String, Float, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, Enum, Index
 from sqlalchemy.sql import func
 from app.config.database import Base
 import enum
@@ -27,6 +27,12 @@ class SensorLog(Base):
     raw_value = Column(Float, nullable=True)  # Original raw reading
     raw_unit = Column(String(20), nullable=True)  # Original unit
 
+    __table_args__ = (
+        # Log listings filter by sensor type and/or zone, newest first
+        Index('ix_sensor_logs_type_timestamp', 'sensor_type', 'timestamp'),
+        Index('ix_sensor_logs_zone_type_timestamp', 'zone_id', 'sensor_type', 'timestamp'),
+    )
+
     def __repr__(self):
         return f"<SensorLog(id={self.id}, type={self.sensor_type.value}, zone={self.zone_id}, value={self.value} {self.unit})>"
 
@@ -1,5 +1,5 @@
 """System log model for storing system events and errors."""
-from sqlalchemy import Column, Integer, String, DateTime, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Index
 from sqlalchemy.sql import func
 from app.config.database import Base
 import enum
@@ -27,6 +27,12 @@ class SystemLog(Base):
     zone_id = Column(Integer, nullable=True, index=True)  # Zone ID if applicable
     sensor_id = Column(String(50), nullable=True)  # Sensor identifier if applicable
 
+    __table_args__ = (
+        # Alerts/log listings filter by level and a time window, newest first
+        Index('ix_system_logs_level_timestamp', 'log_level', 'timestamp'),
+        Index('ix_system_logs_component_timestamp', 'component', 'timestamp'),
+    )
+
     def __repr__(self):
         return f"<SystemLog(id={self.id}, level={self.log_level.value}, component={self.component}, message={self.message[:50]}...)>"
 
@@ -1,10 +1,13 @@
 """Fail-safe mechanisms for system safety."""
+import logging
 from typing import Dict, List, Optional, Callable
 from datetime import datetime, timedelta
 from app.sensors.base import BaseSensor
 from app.config.config import SENSOR_FAILURE_THRESHOLD
 from app.models.system_log import SystemLog, LogLevel
 
+logger = logging.getLogger(__name__)
+
 
 class SensorFailureHandler:
     """Handle sensor failures and degradation."""
@@ -79,7 +82,7 @@ class SensorFailureHandler:
             db.commit()
             db.close()
         except Exception as e:
-            print(f"Error logging sensor failure: {str(e)}")
+            logger.error("Error logging sensor failure: %s", e)
 
 
 class AbnormalReadingHandler:
@@ -143,7 +146,7 @@ class AbnormalReadingHandler:
             db.commit()
             db.close()
         except Exception as e:
-            print(f"Error logging abnormal reading: {str(e)}")
+            logger.error("Error logging abnormal reading: %s", e)
 
 
 class EmergencyStop:
@@ -215,9 +218,7 @@ class HealthMonitor:
             return self._check_system_health_internal()
         except Exception as e:
             # Catch any unhandled exceptions and return safe response
-            print(f"CRITICAL: Unhandled error in check_system_health: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.critical("Unhandled error in check_system_health: %s", e, exc_info=True)
             return {
                 'overall_status': 'error',
                 'sensor_health': {},
@@ -246,9 +247,7 @@ class HealthMonitor:
             emergency_status = self.emergency_stop.get_status()
             health_status['emergency_stop'] = emergency_status
         except Exception as e:
-            print(f"Error getting emergency stop status: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error getting emergency stop status: %s", e)
             health_status['emergency_stop'] = {
                 'is_stopped': False,
                 'reason': None,
@@ -261,26 +260,24 @@ class HealthMonitor:
         try:
             # Ensure self.sensors is a dict and not None
             if not isinstance(self.sensors, dict):
-                print(f"Warning: self.sensors is not a dict, type: {type(self.sensors)}")
+                logger.warning("self.sensors is not a dict, type: %s", type(self.sensors))
                 self.sensors = {}
             
             # Convert sensor items to list to avoid iteration issues
             sensor_items = list(self.sensors.items()) if self.sensors else []
-            print(f"Checking {len(sensor_items)} sensors...")
+            logger.debug("Checking %d sensors...", len(sensor_items))
             
             for idx, (sensor_id, sensor) in enumerate(sensor_items):
-                print(f"Processing sensor {idx+1}/{len(sensor_items)}: {sensor_id} (type: {type(sensor_id)})")
+                logger.debug("Processing sensor %d/%d: %s", idx + 1, len(sensor_items), sensor_id)
                 try:
                     # Call is_sensor_healthy with error handling
                     try:
                         is_healthy = sensor.is_sensor_healthy()
                         if not isinstance(is_healthy, bool):
-                            print(f"Warning: sensor {sensor_id} returned non-boolean health status: {type(is_healthy)}")
+                            logger.warning("Sensor %s returned non-boolean health status: %s", sensor_id, type(is_healthy))
                             is_healthy = bool(is_healthy)
                     except Exception as e:
-                        print(f"Error calling is_sensor_healthy for {sensor_id}: {e}")
-                        import traceback
-                        traceback.print_exc()
+                        logger.exception("Error calling is_sensor_healthy for %s: %s", sensor_id, e)
                         is_healthy = False
                     
                     sensor_info = {
@@ -302,7 +299,7 @@ class HealthMonitor:
                             else:
                                 sensor_info['zone_id'] = str(zone_id_val)
                         except Exception as e:
-                            print(f"Error processing zone_id for {sensor_id}: {e}")
+                            logger.error("Error processing zone_id for %s: %s", sensor_id, e)
                             sensor_info['zone_id'] = None
                     
                     health_status['sensor_health'][sensor_id] = sensor_info
@@ -311,9 +308,7 @@ class HealthMonitor:
                         failed_sensors.append(str(sensor_id))  # Ensure sensor_id is string
                 except Exception as e:
                     # If sensor check fails, mark as unhealthy but don't crash
-                    print(f"Error processing sensor {sensor_id}: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    logger.exception("Error processing sensor %s: %s", sensor_id, e)
                     health_status['sensor_health'][str(sensor_id)] = {
                         'healthy': False,
                         'error': str(e)
@@ -321,9 +316,7 @@ class HealthMonitor:
                     failed_sensors.append(str(sensor_id))
         except Exception as e:
             # If iterating sensors fails, log but continue
-            print(f"Error checking sensors: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error checking sensors: %s", e)
         
         # Determine overall status - ensure all values are ints for comparison
         try:
@@ -335,7 +328,7 @@ class HealthMonitor:
             try:
                 is_stopped = bool(self.emergency_stop.is_stopped())
             except Exception as e:
-                print(f"Error checking emergency stop: {e}")
+                logger.error("Error checking emergency stop: %s", e)
                 is_stopped = False
             
             if is_stopped:
@@ -351,9 +344,7 @@ class HealthMonitor:
                     health_status['failed_sensors'] = failed_sensors
         except Exception as e:
             # If status determination fails, just mark as healthy but log error
-            print(f"Error determining overall status: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error determining overall status: %s", e)
             health_status['overall_status'] = 'healthy'  # Default to healthy if we can't determine
         
         self.last_health_check = datetime.now()
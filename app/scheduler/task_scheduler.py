@@ -1,4 +1,5 @@
 """Task scheduler for automated irrigation/fertigation cycles."""
+import logging
 import threading
 import time
 from datetime import datetime, time as dt_time
@@ -26,6 +27,8 @@ except ImportError:
             ZoneInfo = None
             pytz = None
 
+logger = logging.getLogger(__name__)
+
 
 class TaskScheduler:
     """Background scheduler for irrigation and fertigation tasks."""
@@ -68,7 +71,7 @@ class TaskScheduler:
             try:
                 self._check_and_trigger_schedules()
             except Exception as e:
-                print(f"Scheduler error: {str(e)}")
+                logger.error("Scheduler error: %s", e)
             
             time.sleep(self.check_interval)
 
@@ -80,7 +83,7 @@ class TaskScheduler:
                 try:
                     return ZoneInfo(SCHEDULE_TIMEZONE)
                 except Exception as e:
-                    print(f"Warning: Could not load timezone '{SCHEDULE_TIMEZONE}' with zoneinfo: {e}")
+                    logger.warning("Could not load timezone '%s' with zoneinfo: %s", SCHEDULE_TIMEZONE, e)
                     # Fall through to pytz
                     pass
             
@@ -89,11 +92,11 @@ class TaskScheduler:
                 try:
                     return pytz.timezone(SCHEDULE_TIMEZONE)
                 except Exception as e:
-                    print(f"Warning: Could not load timezone '{SCHEDULE_TIMEZONE}' with pytz: {e}")
-                    print("Warning: Using system local time instead")
+                    logger.warning("Could not load timezone '%s' with pytz: %s; using system local time instead",
+                                   SCHEDULE_TIMEZONE, e)
                     return None
             else:
-                print("Warning: timezone library not available, using system local time")
+                logger.warning("Timezone library not available, using system local time")
                 return None
         else:
             # Use system local timezone
@@ -220,7 +223,7 @@ class TaskScheduler:
             db.commit()
             
         except Exception as e:
-            print(f"Error triggering irrigation for schedule {schedule.id}: {str(e)}")
+            logger.error("Error triggering irrigation for schedule %s: %s", schedule.id, e)
 
     def _trigger_fertigation(self, schedule: FertigationSchedule, db):
         """Trigger fertigation for a schedule."""
@@ -233,5 +236,5 @@ class TaskScheduler:
             db.commit()
             
         except Exception as e:
-            print(f"Error triggering fertigation for schedule {schedule.id}: {str(e)}")
+            logger.error("Error triggering fertigation for schedule %s: %s", schedule.id, e)
 
@@ -1,4 +1,6 @@
 """Base sensor abstract class."""
+import threading
+import time
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any
 from datetime import datetime
@@ -7,6 +9,9 @@ from datetime import datetime
 class BaseSensor(ABC):
     """Abstract base class for all sensors."""
 
+    # Sensor family tag (e.g. 'soil_moisture'), set by each concrete sensor class
+    family: Optional[str] = None
+
     def __init__(self, sensor_id: str, zone_id: Optional[int] = None):
         """
         Initialize sensor.
@@ -19,8 +24,11 @@ class BaseSensor(ABC):
         self.zone_id = zone_id
         self.last_reading: Optional[Dict[str, Any]] = None
         self.last_reading_time: Optional[datetime] = None
+        # Monotonic stamp of last_reading, used for freshness checks
+        self.last_reading_monotonic: Optional[float] = None
         self.is_healthy = True
         self.failure_count = 0
+        self._read_lock = threading.Lock()
 
     @abstractmethod
     def read_raw(self) -> Dict[str, Any]:
@@ -42,6 +50,27 @@ class BaseSensor(ABC):
         """
         pass
 
+    def read_cached(self, max_age_sec: float = 1.5) -> Dict[str, Any]:
+        """
+        Return the last standardized reading if it is recent, otherwise read again.
+        
+        Callers polling at the same time (status endpoints, control loops)
+        share one hardware read per max_age_sec window.
+        
+        Args:
+            max_age_sec: Maximum age in seconds of a reading that may be reused
+            
+        Returns:
+            Standardized reading, as returned by read_standardized()
+        """
+        with self._read_lock:
+            if self.last_reading is not None and self.last_reading_monotonic is not None:
+                # A negative age can't be trusted, so it counts as stale
+                age = time.monotonic() - self.last_reading_monotonic
+                if 0 <= age < max_age_sec:
+                    return self.last_reading
+            return self.read_standardized()
+
     def get_last_reading(self) -> Optional[Dict[str, Any]]:
         """Get the last successful reading."""
         return self.last_reading
@@ -1,6 +1,7 @@
 """Water pressure sensor interface."""
 from typing import Dict, Any, Optional
 from datetime import datetime
+import time
 from app.sensors.base import BaseSensor
 from app.hardware.ads1115_adc import ADS1115ADC
 from app.utils.noise_filter import NoiseFilter
@@ -10,6 +11,8 @@ from app.utils.unit_converter import UnitConverter
 class PressureSensor(BaseSensor):
     """Water pressure sensor with noise filtering via ADS1115 ADC."""
 
+    family = 'pressure'
+
     def __init__(self, sensor_id: str, adc: ADS1115ADC, channel: int, zone_id: Optional[int] = None,
                  min_pressure_kpa: float = 0.0, max_pressure_kpa: float = 600.0):
         """
@@ -148,6 +151,7 @@ class PressureSensor(BaseSensor):
         
         self.last_reading = reading
         self.last_reading_time = datetime.now()
+        self.last_reading_monotonic = time.monotonic()
         
         return reading
 
@@ -5,6 +5,7 @@ degrees for the single-zone system configuration.
 """
 from typing import Dict, Any, Optional
 from datetime import datetime
+import time
 from app.sensors.base import BaseSensor
 from app.utils.noise_filter import NoiseFilter
 from app.utils.unit_converter import UnitConverter
@@ -13,6 +14,8 @@ from app.utils.unit_converter import UnitConverter
 class SlopeSensor(BaseSensor):
     """Sensor for slope readings in degrees."""
 
+    family = 'slope'
+
     def __init__(self, sensor_id: str, zone_id: Optional[int] = None,
                  slope_degrees: float = 0.0):
         """
@@ -72,6 +75,7 @@ class SlopeSensor(BaseSensor):
         
         self.last_reading = reading
         self.last_reading_time = datetime.now()
+        self.last_reading_monotonic = time.monotonic()
         
         return reading
 
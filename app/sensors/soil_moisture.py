@@ -1,6 +1,7 @@
 """Capacitive soil moisture sensor (V2) interface."""
 from typing import Dict, Any, Optional
 from datetime import datetime
+import time
 from app.sensors.base import BaseSensor
 from app.hardware.ads1115_adc import ADS1115ADC
 from app.utils.noise_filter import NoiseFilter
@@ -11,6 +12,8 @@ from app.config.config import MIN_SOIL_MOISTURE_PERCENT, MAX_SOIL_MOISTURE_PERCE
 class SoilMoistureSensor(BaseSensor):
     """Capacitive soil moisture sensor V2 with calibration via ADS1115 ADC."""
 
+    family = 'soil_moisture'
+
     def __init__(self, sensor_id: str, adc: ADS1115ADC, channel: int, zone_id: Optional[int] = None,
                  dry_value: float = 0.0, wet_value: float = 1.0):
         """
@@ -111,6 +114,7 @@ class SoilMoistureSensor(BaseSensor):
         
         self.last_reading = reading
         self.last_reading_time = datetime.now()
+        self.last_reading_monotonic = time.monotonic()
         
         return reading
 
@@ -14,6 +14,8 @@ class TankLevelSensor(BaseSensor):
     Calibration: empty_distance_cm (e.g. 100) = empty tank, full_distance_cm (e.g. 10) = full tank.
     """
 
+    family = 'tank_level'
+
     def __init__(self, sensor_id: str, gpio: GPIOInterface, trigger_pin: int, echo_pin: int,
                  tank_height_cm: float = 50.0,
                  empty_distance_cm: float = 100.0,
@@ -160,5 +162,6 @@ class TankLevelSensor(BaseSensor):
         }
         self.last_reading = reading
         self.last_reading_time = datetime.now()
+        self.last_reading_monotonic = time.monotonic()
         return reading
 
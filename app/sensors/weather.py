@@ -1,6 +1,7 @@
 """Weather data reader from WeatherCurrent model."""
 from typing import Dict, Any, Optional
 from datetime import datetime
+import time
 from flask import current_app
 from app.sensors.base import BaseSensor
 from app.models.weather_records import WeatherCurrent
@@ -9,6 +10,8 @@ from app.models.weather_records import WeatherCurrent
 class WeatherReader(BaseSensor):
     """Interface to read weather data from WeatherCurrent model."""
 
+    family = 'weather'
+
     def __init__(self, sensor_id: str = "weather_reader", app=None):
         """
         Initialize weather reader.
@@ -164,6 +167,7 @@ class WeatherReader(BaseSensor):
         
         self.last_reading = reading
         self.last_reading_time = datetime.now()
+        self.last_reading_monotonic = time.monotonic()
         
         return reading
 
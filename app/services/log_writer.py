@@ -0,0 +1,114 @@
+"""Background writer that batches log rows into a single transaction."""
+import atexit
+import queue
+import threading
+import time
+from typing import Callable, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class LogWriter:
+    """Queue log model instances and persist them in batches from a daemon thread."""
+
+    def __init__(self, db_session_factory: Callable, max_batch: int = 100,
+                 max_delay_sec: float = 0.05, max_queue: int = 10000):
+        """
+        Initialize log writer.
+
+        Args:
+            db_session_factory: Function that returns a database session generator
+            max_batch: Maximum number of rows written per transaction
+            max_delay_sec: Maximum time to wait for a batch to fill before writing
+            max_queue: Maximum number of pending rows before writes become synchronous
+        """
+        self.db_session_factory = db_session_factory
+        self.max_batch = max_batch
+        self.max_delay_sec = max_delay_sec
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, row):
+        """
+        Queue a model instance for writing.
+
+        If the queue is full the row is written synchronously, so a slow
+        database applies back-pressure instead of dropping log entries.
+
+        Args:
+            row: SQLAlchemy model instance to insert
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._write([row])
+
+    def flush(self):
+        """Write every row queued so far on the calling thread."""
+        # One transaction per max_batch rows, until the queue is empty
+        while True:
+            batch = self._drain_nowait()
+            if not batch:
+                break
+            self._write(batch)
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._writer_loop, daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _drain_nowait(self) -> List:
+        batch = []
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _writer_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_delay_sec
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._write(batch)
+
+    def _write(self, batch: List):
+        if self._commit(batch) or len(batch) == 1:
+            return
+        # Retry one row per transaction so a bad row only loses itself
+        for row in batch:
+            self._commit([row])
+
+    def _commit(self, rows: List) -> bool:
+        """Insert rows in one transaction; return whether it committed."""
+        db = None
+        try:
+            db = next(self.db_session_factory())
+            # add_all (not bulk inserts) so mapper events such as API cache
+            # invalidation still fire for every row
+            db.add_all(rows)
+            db.commit()
+            return True
+        except Exception as e:
+            logger.error("Error writing %d log rows: %s", len(rows), e)
+            if db:
+                db.rollback()
+            return False
+        finally:
+            if db:
+                db.close()
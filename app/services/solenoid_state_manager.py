@@ -8,6 +8,15 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _serialize_solenoid(name: str, is_open: int, last_updated: Optional[datetime]) -> Dict:
+    """Build the API representation of one solenoid_status row."""
+    return {
+        'solenoid_name': name,
+        'is_open': is_open == 1,
+        'last_updated': last_updated.isoformat() if last_updated else None
+    }
+
+
 class SolenoidStateManager:
     """Manager for tracking and persisting solenoid valve states."""
 
@@ -29,7 +38,7 @@ class SolenoidStateManager:
             db = next(get_db())
             
             for solenoid_name in self.DEFAULT_SOLENOIDS:
-                existing = db.query(SolenoidStatus).filter_by(solenoid_name=solenoid_name).first()
+                existing = db.get(SolenoidStatus, solenoid_name)
                 if not existing:
                     new_solenoid = SolenoidStatus(
                         solenoid_name=solenoid_name,
@@ -63,7 +72,7 @@ class SolenoidStateManager:
             db = next(get_db())
             
             # Check if solenoid exists, create if not
-            solenoid = db.query(SolenoidStatus).filter_by(solenoid_name=solenoid_name).first()
+            solenoid = db.get(SolenoidStatus, solenoid_name)
             
             if solenoid:
                 solenoid.is_open = 1 if is_open else 0
@@ -102,7 +111,7 @@ class SolenoidStateManager:
         """
         try:
             db = next(get_db())
-            solenoid = db.query(SolenoidStatus).filter_by(solenoid_name=solenoid_name).first()
+            solenoid = db.get(SolenoidStatus, solenoid_name)
             db.close()
             
             if solenoid:
@@ -166,7 +175,7 @@ class SolenoidStateManager:
             db = next(get_db())
             
             # Check if already exists
-            existing = db.query(SolenoidStatus).filter_by(solenoid_name=solenoid_name).first()
+            existing = db.get(SolenoidStatus, solenoid_name)
             if existing:
                 db.close()
                 logger.warning(f"Solenoid {solenoid_name} already exists")
@@ -204,15 +213,11 @@ class SolenoidStateManager:
         """
         try:
             db = next(get_db())
-            solenoid = db.query(SolenoidStatus).filter_by(solenoid_name=solenoid_name).first()
+            solenoid = db.get(SolenoidStatus, solenoid_name)
             db.close()
             
             if solenoid:
-                return {
-                    'solenoid_name': solenoid.solenoid_name,
-                    'is_open': solenoid.is_open == 1,
-                    'last_updated': solenoid.last_updated.isoformat() if solenoid.last_updated else None
-                }
+                return _serialize_solenoid(solenoid.solenoid_name, solenoid.is_open, solenoid.last_updated)
             else:
                 return None
                 
@@ -222,3 +227,31 @@ class SolenoidStateManager:
                 db.close()
             return None
 
+    def get_all_solenoid_info(self) -> Dict[str, Dict]:
+        """
+        Get detailed information about every solenoid in one query.
+        
+        Returns:
+            Dictionary mapping solenoid names to the same dictionaries
+            returned by get_solenoid_info()
+        """
+        db = None
+        try:
+            db = next(get_db())
+            rows = db.query(
+                SolenoidStatus.solenoid_name,
+                SolenoidStatus.is_open,
+                SolenoidStatus.last_updated
+            ).all()
+            db.close()
+            
+            return {
+                name: _serialize_solenoid(name, is_open, last_updated)
+                for name, is_open, last_updated in rows
+            }
+            
+        except Exception as e:
+            logger.error(f"Error getting all solenoid info: {str(e)}")
+            if db:
+                db.close()
+            return {}
@@ -0,0 +1,62 @@
+"""Time-based cache of the latest standardized weather reading."""
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+
+from app.config.config import WEATHER_CACHE_TTL_SEC
+from app.models.weather_records import WeatherCurrent
+
+# Every live cache, so a newly stored weather record can invalidate them all
+_caches = weakref.WeakSet()
+
+
+class WeatherCache:
+    """Reuse a weather reader's last reading for a fixed time window."""
+
+    def __init__(self, weather_reader, ttl_sec: float = WEATHER_CACHE_TTL_SEC):
+        """
+        Initialize weather cache.
+
+        Args:
+            weather_reader: Weather reader exposing ``read_standardized()``
+            ttl_sec: How long a reading is reused before the reader is queried again
+        """
+        self.weather_reader = weather_reader
+        self.ttl_sec = ttl_sec
+        self._reading: Optional[Dict[str, Any]] = None
+        self._read_at = 0.0
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    def read(self) -> Dict[str, Any]:
+        """
+        Return the cached reading, or read the weather again once it has expired.
+
+        Concurrent callers wait on one read instead of each querying the
+        reader. Failed reads are not cached, so the next call retries.
+
+        Returns:
+            Standardized weather reading
+        """
+        with self._lock:
+            if self._reading is not None and time.monotonic() - self._read_at < self.ttl_sec:
+                return self._reading
+            reading = self.weather_reader.read_standardized()
+            self._reading = reading
+            self._read_at = time.monotonic()
+            return reading
+
+    def invalidate(self):
+        """Drop the cached reading so the next read queries the reader."""
+        with self._lock:
+            self._reading = None
+
+
+@event.listens_for(WeatherCurrent, 'after_insert')
+@event.listens_for(WeatherCurrent, 'after_update')
+def _invalidate_weather_caches(mapper, connection, target):
+    for cache in list(_caches):
+        cache.invalidate()
@@ -7,6 +7,7 @@ become user-configurable at runtime via the database.
 
 from typing import Any, Dict, List, Tuple
 
+from sqlalchemy import bindparam, insert, select, update
 from sqlalchemy.exc import IntegrityError
 
 from app.models.system_config import SystemConfig
@@ -58,6 +59,27 @@ SYSTEM_CONFIG_SCHEMA: Dict[str, Dict[str, Any]] = {
 }
 
 
+# Raw (key, value) pairs for every schema key, fetched as plain tuples
+_SELECT_SCHEMA_VALUES = select(SystemConfig.key, SystemConfig.value).where(
+    SystemConfig.key.in_([meta["db_key"] for meta in SYSTEM_CONFIG_SCHEMA.values()])
+)
+
+
+# Core statements (on the table, not the mapped class) so updates run as a
+# plain executemany without loading rows into the session
+_UPDATE_VALUE_BY_KEY = (
+    update(SystemConfig.__table__)
+    .where(SystemConfig.__table__.c.key == bindparam("db_key"))
+    .values(value=bindparam("new_value"))
+)
+_INSERT_ROW = insert(SystemConfig.__table__)
+
+
+def _load_raw_values(db) -> Dict[str, str]:
+    """Return stored values for all schema keys in one query, keyed by db_key."""
+    return dict(db.execute(_SELECT_SCHEMA_VALUES).all())
+
+
 def load_system_config(db) -> Dict[str, Any]:
     """Load system configuration values from the database.
 
@@ -66,6 +88,7 @@ def load_system_config(db) -> Dict[str, Any]:
     the user customizes anything.
     """
     config_values: Dict[str, Any] = {}
+    raw_values = _load_raw_values(db)
 
     # First pass: determine which keys are missing and need seeding.
     to_seed: List[Tuple[str, Any, str]] = []
@@ -74,8 +97,7 @@ def load_system_config(db) -> Dict[str, Any]:
         default_value = meta.get("default")
         description = meta.get("description")
 
-        row = db.query(SystemConfig).filter_by(key=db_key).first()
-        if row is None:
+        if db_key not in raw_values:
             to_seed.append((db_key, default_value, description))
 
     # Batch-insert any missing keys and commit once. Handle races where another
@@ -89,6 +111,7 @@ def load_system_config(db) -> Dict[str, Any]:
             # Another process may have inserted some/all keys; rollback and
             # re-read below without assuming our inserts succeeded.
             db.rollback()
+        raw_values = _load_raw_values(db)
 
     # Second pass: build the typed config dict from whatever is now in the DB,
     # falling back to defaults if conversion fails or a row is still absent.
@@ -97,14 +120,14 @@ def load_system_config(db) -> Dict[str, Any]:
         default_value = meta.get("default")
         value_type = meta.get("type", float)
 
-        row = db.query(SystemConfig).filter_by(key=db_key).first()
-        if row is None:
+        raw_value = raw_values.get(db_key)
+        if raw_value is None:
             # As a last resort, use the default directly without seeding again.
             config_values[name] = default_value
             continue
 
         try:
-            typed_value = value_type(row.value)
+            typed_value = value_type(raw_value)
         except (TypeError, ValueError):
             typed_value = default_value
 
@@ -140,6 +163,9 @@ def update_system_config(db, updates: Dict[str, Any]) -> Dict[str, Any]:
     applied_keys: List[str] = []
     unknown_keys: List[str] = []
     invalid_values: Dict[str, Any] = {}
+    existing_keys = _load_raw_values(db).keys()
+    to_update: List[Dict[str, str]] = []
+    to_insert: List[Dict[str, Any]] = []
 
     for name, raw_value in updates.items():
         meta = SYSTEM_CONFIG_SCHEMA.get(name)
@@ -159,15 +185,19 @@ def update_system_config(db, updates: Dict[str, Any]) -> Dict[str, Any]:
             invalid_values[name] = raw_value
             continue
 
-        row = db.query(SystemConfig).filter_by(key=db_key).first()
-        if row is None:
-            row = SystemConfig(key=db_key, value=str(cast_value), description=description)
-            db.add(row)
+        if db_key in existing_keys:
+            to_update.append({"db_key": db_key, "new_value": str(cast_value)})
         else:
-            row.value = str(cast_value)
+            to_insert.append({"key": db_key, "value": str(cast_value), "description": description})
 
         applied_keys.append(name)
 
+    # One statement each for existing and new keys instead of a SELECT plus
+    # ORM flush per key
+    if to_update:
+        db.execute(_UPDATE_VALUE_BY_KEY, to_update)
+    if to_insert:
+        db.execute(_INSERT_ROW, to_insert)
     db.commit()
 
     result["config"] = load_system_config(db)
@@ -1,23 +1,47 @@
 """Main Flask application for irrigation and fertigation control system."""
 from flask import Flask, jsonify
 from flask_cors import CORS
+from flask_compress import Compress
 from app.models.weather_records import db, init_db
 from app.ml.background_task import init_background_task
+import atexit
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Configure logging: callers only enqueue records; formatting and stream
+# writes happen on the listener's background thread
+_log_queue = queue.Queue(-1)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 )
+_log_listener = QueueListener(_log_queue, _log_stream_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
 
 # Initialize Flask app
 app = Flask(__name__)
+# Match routes with or without a trailing slash instead of issuing a 308
+# redirect; must be set before any blueprint rules are registered
+app.url_map.strict_slashes = False
 
 # Enable CORS for all routes
 CORS(app)
 
+# Compress JSON responses for clients that send Accept-Encoding; level 1/low
+# brotli quality keeps CPU cost on the Pi small while still shrinking the
+# polled sensor/solenoid payloads several-fold
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 1
+app.config['COMPRESS_BR_LEVEL'] = 1
+app.config['COMPRESS_MIN_SIZE'] = 512
+Compress(app)
+
 # Configure Flask-SQLAlchemy for weather database
 from app.config.config import WEATHER_DB_PATH, USE_MOCK_HARDWARE
 app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{WEATHER_DB_PATH}'
@@ -291,6 +315,9 @@ task_scheduler.start()
 
 # Register API blueprints
 from app.api import api_bp
+from app.api.responses import OrjsonProvider
+# Serialize jsonify() responses and parse request bodies with orjson
+app.json = OrjsonProvider(app)
 app.register_blueprint(api_bp)
 
 # Set up API controller references
@@ -299,14 +326,15 @@ system.system_state['controllers'] = {
     'irrigation': irrigation_controller,
     'fertigation': fertigation_controller
 }
-irrigation.controllers = {
+irrigation.set_controllers({
     'irrigation': irrigation_controller
-}
-fertigation.controllers = {
+})
+fertigation.set_controllers({
     'fertigation': fertigation_controller
-}
+})
 # Set up sensors reference for API
 sensors.sensors_dict = all_sensors
+sensors.freeze_sensors()
 logging.info(f"✓ Sensors dict set in API module with {len(all_sensors)} sensors: {list(all_sensors.keys())}")
 
 # Set up hardware instances for mock value control (only in mock mode)
@@ -337,9 +365,7 @@ def health_check():
     except Exception as e:
         # Return a basic health status even if health check fails
         # This ensures the endpoint is always available for connection testing
-        import traceback
-        print(f"Health check error: {e}")
-        print(traceback.format_exc())
+        logging.exception("Health check error")
         return jsonify({
             'overall_status': 'error',
             'message': 'Health check encountered an error',
@@ -351,4 +377,20 @@ def health_check():
 if __name__ == '__main__':
     print("Starting Irrigation and Fertigation Control System...")
     print(f"Hardware mode: {'MOCK' if USE_MOCK_HARDWARE else 'REAL'}")
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    try:
+        import uvicorn
+    except ImportError:
+        uvicorn = None
+
+    if uvicorn is not None:
+        # Serve the WSGI app from uvicorn (uvloop + httptools when installed);
+        # each request runs on uvicorn's threadpool so blocking GPIO/I2C and DB
+        # calls don't serialize other requests. Keep a single worker: hardware,
+        # the scheduler and background tasks are initialized at import time.
+        uvicorn.run(app, host='0.0.0.0', port=5000, interface='wsgi',
+                    loop='auto', http='auto', workers=1)
+    else:
+        # Debugger only on explicit opt-in; the reloader would re-import this
+        # module and initialize hardware and the scheduler twice
+        app.run(host='0.0.0.0', port=5000, debug=os.getenv('FLASK_DEBUG') == '1',
+                use_reloader=False, threaded=True)
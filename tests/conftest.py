@@ -205,12 +205,12 @@ def app(irrigation_controller, fertigation_controller):
     """Create Flask app for testing."""
     # Set controllers in API modules
     from app.api import irrigation, fertigation
-    irrigation.controllers = {
+    irrigation.set_controllers({
         'irrigation': irrigation_controller,
-    }
-    fertigation.controllers = {
+    })
+    fertigation.set_controllers({
         'fertigation': fertigation_controller
-    }
+    })
     
     # Create a minimal Flask app for testing
     from flask import Flask
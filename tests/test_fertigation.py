@@ -25,14 +25,14 @@ class TestFertigationAPI:
         
         original_controllers = dict(fertigation_api.controllers)
         try:
-            fertigation_api.controllers = {}
+            fertigation_api.set_controllers({})
             response = client.post('/api/fertigation/start', json={'some': 'payload'})
             assert response.status_code == 500
             data = response.get_json()
             assert data['success'] is False
             assert 'controller not initialized' in data['error'].lower()
         finally:
-            fertigation_api.controllers = original_controllers
+            fertigation_api.set_controllers(original_controllers)
     
     def test_start_fertigation_already_running(self, client, fertigation_controller):
         """Test starting fertigation when already running."""
@@ -145,6 +145,62 @@ class TestFertigationController:
         assert stop_result['success'] is True
         assert fertigation_controller.is_running is False
 
+    def test_fertigation_restart_can_be_stopped(self, fertigation_controller):
+        """Test a run started right after a stop can still be stopped."""
+        assert fertigation_controller.start_fertigation(1)['success'] is True
+        assert fertigation_controller.stop_fertigation()['success'] is True
+
+        result = fertigation_controller.start_fertigation(2)
+        assert result['success'] is True
+        assert fertigation_controller.is_running is True
+        assert fertigation_controller.current_zone == 2
+
+        # Give the first cycle time to unwind; it must not clear the new run
+        time.sleep(0.5)
+        assert fertigation_controller.is_running is True
+        assert fertigation_controller.current_zone == 2
+
+        stop_result = fertigation_controller.stop_fertigation()
+        assert stop_result['success'] is True
+        assert fertigation_controller.is_running is False
+
+    def test_fertigation_worker_survives_cleanup_error(self, fertigation_controller):
+        """Test a cycle whose error cleanup raises still lets later cycles run."""
+        valve_controller = fertigation_controller.valve_controller
+        original_close_all = valve_controller.close_all_zones
+        original_close_zone = valve_controller.close_zone
+        calls = []
+
+        def failing_close_all():
+            calls.append('close_all_zones')
+            raise Exception('valve failure')
+
+        def failing_close_zone(zone_id):
+            raise Exception('valve failure')
+
+        valve_controller.close_all_zones = failing_close_all
+        valve_controller.close_zone = failing_close_zone
+        assert fertigation_controller.start_fertigation(1)['success'] is True
+
+        start = time.time()
+        while fertigation_controller.is_running and (time.time() - start) < 5:
+            time.sleep(0.05)
+        assert fertigation_controller.is_running is False
+
+        # The next cycle must still be picked up
+        def recording_close_all():
+            calls.append('close_all_zones')
+            return original_close_all()
+
+        valve_controller.close_all_zones = recording_close_all
+        valve_controller.close_zone = original_close_zone
+        assert fertigation_controller.start_fertigation(1)['success'] is True
+        start = time.time()
+        while len(calls) < 2 and (time.time() - start) < 5:
+            time.sleep(0.05)
+        assert len(calls) == 2
+        fertigation_controller.stop_fertigation()
+
     def test_fertigation_stop_not_running(self, fertigation_controller):
         """Test stop_fertigation when no operation is running."""
         result = fertigation_controller.stop_fertigation()
@@ -156,14 +156,14 @@ class TestIrrigationAPI:
         
         original_controllers = dict(irrigation_api.controllers)
         try:
-            irrigation_api.controllers = {}
+            irrigation_api.set_controllers({})
             response = client.post('/api/irrigation/start', json={'zone_id': 1})
             assert response.status_code == 500
             data = response.get_json()
             assert data['success'] is False
             assert 'controller not initialized' in data['error'].lower()
         finally:
-            irrigation_api.controllers = original_controllers
+            irrigation_api.set_controllers(original_controllers)
     
     def test_start_irrigation_serialization_error_handled(self, client, monkeypatch):
         """Test irrigation start handles JSON serialization errors gracefully."""
@@ -180,14 +180,14 @@ class TestIrrigationAPI:
         
         original_controllers = dict(irrigation_api.controllers)
         try:
-            irrigation_api.controllers = {'irrigation': BadController()}
+            irrigation_api.set_controllers({'irrigation': BadController()})
             response = client.post('/api/irrigation/start', json={'zone_id': 1})
             assert response.status_code == 500
             data = response.get_json()
             assert data['success'] is False
             assert 'data serialization failed' in data['error'].lower()
         finally:
-            irrigation_api.controllers = original_controllers
+            irrigation_api.set_controllers(original_controllers)
 
 
 class TestIrrigationController:
@@ -428,3 +428,65 @@ class TestIrrigationController:
 
         irrigation_controller.decision_engine.should_irrigate = original_decision
 
+
+    def test_stop_during_setup_leaves_pump_off(self, irrigation_controller, mock_adc, monkeypatch):
+        """Test a stop that lands while the cycle is loading its config."""
+        import threading
+        mock_adc.set_mock_value(1, 0.686)
+        irrigation_controller.decision_engine.should_irrigate = lambda moisture, weather: {
+            'should_irrigate': True,
+            'reason': 'test-allow',
+            'user_message': 'ok',
+            'confidence': 1.0,
+        }
+
+        # Hold the cycle in setup until the stop has run
+        in_setup = threading.Event()
+        release = threading.Event()
+
+        def slow_config(db):
+            in_setup.set()
+            release.wait(5)
+            return {}
+
+        import app.controllers.irrigation_controller as ic_mod
+        monkeypatch.setattr(ic_mod, 'load_system_config', slow_config)
+
+        zone_config = {'slope': 0.0, 'base_pressure': 200.0}
+        assert irrigation_controller.start_irrigation(1, zone_config)['success'] is True
+        assert in_setup.wait(5)
+        assert irrigation_controller.stop_irrigation()['success'] is True
+        release.set()
+        irrigation_controller.operation_thread.join(5)
+
+        assert irrigation_controller.pump_controller.pump_interface.is_running() is False
+        assert irrigation_controller.valve_controller.is_zone_open(1) is False
+        assert irrigation_controller.is_running is False
+
+    def test_stop_while_opening_valve_leaves_pump_off(self, irrigation_controller, mock_adc):
+        """Test a stop that lands after setup's stop check still shuts everything down."""
+        mock_adc.set_mock_value(1, 0.686)
+        irrigation_controller.decision_engine.should_irrigate = lambda moisture, weather: {
+            'should_irrigate': True,
+            'reason': 'test-allow',
+            'user_message': 'ok',
+            'confidence': 1.0,
+        }
+
+        # Stop right before the cycle opens the valve and starts the pump
+        valve_controller = irrigation_controller.valve_controller
+        original_open = valve_controller.open_zone
+
+        def open_after_stop(zone_id, close_others=True):
+            irrigation_controller.stop_irrigation()
+            return original_open(zone_id, close_others=close_others)
+
+        valve_controller.open_zone = open_after_stop
+
+        zone_config = {'slope': 0.0, 'base_pressure': 200.0}
+        assert irrigation_controller.start_irrigation(1, zone_config)['success'] is True
+        irrigation_controller.operation_thread.join(5)
+
+        assert irrigation_controller.pump_controller.pump_interface.is_running() is False
+        assert valve_controller.is_zone_open(1) is False
+        assert irrigation_controller.is_running is False
@@ -0,0 +1,80 @@
+"""Tests for the batched log writer."""
+import pytest
+from app.services.log_writer import LogWriter
+
+
+class _RecordingSession:
+    """Session stand-in that records each committed batch."""
+
+    def __init__(self, commits):
+        self.commits = commits
+        self.pending = []
+
+    def add_all(self, rows):
+        self.pending.extend(rows)
+
+    def commit(self):
+        self.commits.append(list(self.pending))
+        self.pending = []
+
+    def rollback(self):
+        self.pending = []
+
+    def close(self):
+        pass
+
+
+class TestLogWriter:
+    """Test log writer batching."""
+
+    @pytest.fixture
+    def writer(self, monkeypatch):
+        commits = []
+
+        def session_factory():
+            yield _RecordingSession(commits)
+
+        writer = LogWriter(session_factory, max_batch=10)
+        # Keep the background thread out so flush() does all the writing
+        monkeypatch.setattr(writer, '_ensure_started', lambda: None)
+        writer.commits = commits
+        return writer
+
+    def test_flush_writes_every_queued_row(self, writer):
+        """Test flush drains more than max_batch rows in max_batch chunks."""
+        rows = list(range(25))
+        for row in rows:
+            writer.submit(row)
+
+        writer.flush()
+
+        assert [len(batch) for batch in writer.commits] == [10, 10, 5]
+        assert [row for batch in writer.commits for row in batch] == rows
+
+    def test_flush_empty_queue(self, writer):
+        """Test flush with nothing queued writes nothing."""
+        writer.flush()
+        assert writer.commits == []
+
+    def test_failed_batch_only_loses_bad_row(self, monkeypatch):
+        """Test a batch that fails to commit is retried one row at a time."""
+        commits = []
+
+        class _RejectingSession(_RecordingSession):
+            def commit(self):
+                if 'bad' in self.pending:
+                    self.pending = []
+                    raise Exception('constraint failed')
+                super().commit()
+
+        def session_factory():
+            yield _RejectingSession(commits)
+
+        writer = LogWriter(session_factory, max_batch=10)
+        monkeypatch.setattr(writer, '_ensure_started', lambda: None)
+        for row in ['a', 'bad', 'b']:
+            writer.submit(row)
+
+        writer.flush()
+
+        assert commits == [['a'], ['b']]
@@ -0,0 +1,122 @@
+"""Tests for schedule API endpoints."""
+import os
+import shutil
+import tempfile
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from app.config.database import Base
+from app.models import IrrigationSchedule
+
+
+@pytest.fixture
+def schedule_session(monkeypatch):
+    """Point the schedule endpoints at a temporary database."""
+    temp_dir = tempfile.mkdtemp()
+    db_path = os.path.join(temp_dir, 'test_schedules.db')
+    engine = create_engine(f'sqlite:///{db_path}', connect_args={'check_same_thread': False}, echo=False)
+    Base.metadata.create_all(bind=engine)
+    session = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
+
+    from app.api import schedules as schedules_api
+    monkeypatch.setattr(schedules_api, 'SessionLocal', session)
+    # Cached lists from other tests belong to a different database
+    schedules_api._invalidate_lists()
+
+    yield session
+
+    session.remove()
+    engine.dispose()
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class TestScheduleAPI:
+    """Test schedule API endpoints."""
+
+    def test_create_schedule(self, client, schedule_session):
+        """Test creating a single schedule returns its id."""
+        response = client.post('/api/schedules/irrigation',
+                               json={'day_of_week': 1, 'time': '06:30'})
+        assert response.status_code == 201
+        data = response.get_json()
+        assert data['success'] is True
+
+        schedule = schedule_session.get(IrrigationSchedule, data['id'])
+        assert schedule is not None
+        assert schedule.day_of_week == 1
+        assert schedule.time.strftime('%H:%M:%S') == '06:30:00'
+        assert schedule.enabled is True
+
+    def test_create_schedule_ids_are_distinct(self, client, schedule_session):
+        """Test consecutive creates return the ids of their own rows."""
+        first = client.post('/api/schedules/irrigation',
+                            json={'day_of_week': 1, 'time': '06:30'}).get_json()
+        second = client.post('/api/schedules/irrigation',
+                             json={'day_of_week': 2, 'time': '18:00:00', 'enabled': False}).get_json()
+        assert first['id'] != second['id']
+        assert schedule_session.get(IrrigationSchedule, second['id']).day_of_week == 2
+
+    def test_create_schedule_missing_fields(self, client, schedule_session):
+        """Test creating a schedule without day_of_week or time."""
+        response = client.post('/api/schedules/irrigation', json={'day_of_week': 1})
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['success'] is False
+        assert schedule_session.execute(select(IrrigationSchedule.id)).all() == []
+
+    def test_create_schedules_batch(self, client, schedule_session):
+        """Test creating several schedules from an items list."""
+        items = [
+            {'day_of_week': 0, 'time': '06:00'},
+            {'day_of_week': 3, 'time': '07:15:00', 'enabled': False},
+            {'day_of_week': 5, 'time': '18:30'},
+        ]
+        response = client.post('/api/schedules/irrigation', json={'items': items})
+        assert response.status_code == 201
+        data = response.get_json()
+        assert data['success'] is True
+        assert len(data['ids']) == len(items)
+
+        # ids come back in the order the items were sent
+        for schedule_id, item in zip(data['ids'], items):
+            schedule = schedule_session.get(IrrigationSchedule, schedule_id)
+            assert schedule.day_of_week == item['day_of_week']
+            assert schedule.enabled is item.get('enabled', True)
+
+    def test_create_schedules_batch_empty(self, client, schedule_session):
+        """Test an empty items list creates nothing."""
+        response = client.post('/api/schedules/irrigation', json={'items': []})
+        assert response.status_code == 201
+        assert response.get_json()['ids'] == []
+
+    def test_create_schedules_batch_invalid_item(self, client, schedule_session):
+        """Test one invalid item rejects the whole batch."""
+        items = [
+            {'day_of_week': 1, 'time': '06:30'},
+            {'day_of_week': 2},
+        ]
+        response = client.post('/api/schedules/irrigation', json={'items': items})
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['success'] is False
+        assert schedule_session.execute(select(IrrigationSchedule.id)).all() == []
+
+    def test_orm_update_invalidates_lists_on_commit(self, client, schedule_session):
+        """Test ORM changes invalidate cached lists at commit, not at flush."""
+        from app.api import schedules as schedules_api
+        schedule_id = client.post('/api/schedules/irrigation',
+                                  json={'day_of_week': 1, 'time': '06:30'}).get_json()['id']
+
+        schedule = schedule_session.get(IrrigationSchedule, schedule_id)
+        schedule.enabled = False
+        generation = schedules_api._list_generation
+        schedule_session.flush()
+        assert schedules_api._list_generation == generation
+
+        schedule_session.commit()
+        assert schedules_api._list_generation != generation
+
+        data = client.get('/api/schedules/irrigation').get_json()
+        assert [s['enabled'] for s in data['schedules']] == [False]
@@ -0,0 +1,18 @@
+"""WSGI entry point for running under Gunicorn with gevent workers.
+
+Usage (Raspberry Pi):
+    gunicorn -k gevent --worker-connections 200 -w 1 -b 0.0.0.0:5000 wsgi:app
+
+Keep a single worker: GPIO, the task scheduler and background threads are
+initialized when ``main`` is imported, so every extra worker would drive the
+same hardware independently.
+"""
+from gevent import monkey
+
+# Must run before anything imports socket/threading/time so that blocking
+# I/O and sleeps in request handlers yield to other greenlets
+monkey.patch_all()
+
+from main import app  # noqa: E402
+
+__all__ = ['app']